@@ -6,6 +6,8 @@ All paths use the persistent DATA_DIR for Railway volume support.
 
 import json
 import os
+import threading
+import unicodedata
 from datetime import datetime
 
 # Resolve DATA_DIR the same way app.py does
@@ -81,20 +83,117 @@ class FighterImageOverride(JSONModel):
         return None
 
 
+def _normalize_name(name):
+    """Lowercase, strip diacritics and collapse whitespace"""
+    decomposed = unicodedata.normalize('NFD', name)
+    ascii_name = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')
+    return ' '.join(ascii_name.lower().split())
+
+
+class BigNameMatcher:
+    """
+    Compiled big-name list.
+
+    Keeps the old bidirectional substring rule (a listed name inside the
+    fighter's name, or the fighter's name inside a listed name) but answers
+    it with set lookups: every substring of every listed name is indexed, and
+    listed names are bucketed by length so a fighter name is scanned with one
+    window per distinct length.
+    """
+
+    def __init__(self, names):
+        normalized = {_normalize_name(n) for n in names if n and n.strip()}
+        self._substrings = set()
+        self._by_length = {}
+        for name in normalized:
+            self._by_length.setdefault(len(name), set()).add(name)
+            for i in range(len(name)):
+                for j in range(i + 1, len(name) + 1):
+                    self._substrings.add(name[i:j])
+        self.size = len(normalized)
+        self.signature = None  # Source file (mtime_ns, size), set by BigNameFighter.matcher()
+
+    def is_big_name(self, fighter_name):
+        name = _normalize_name(fighter_name or '')
+        if not name:
+            return False
+        if name in self._substrings:
+            return True
+        for length, names in self._by_length.items():
+            for i in range(len(name) - length + 1):
+                if name[i:i + length] in names:
+                    return True
+        return False
+
+    def is_big_name_fight(self, fight):
+        return self.is_big_name(fight.get('fighter1', '')) or self.is_big_name(fight.get('fighter2', ''))
+
+    def classify(self, fights):
+        """Big-name flag for every fight in one pass (list of bools, same order)"""
+        cache = {}
+        flags = []
+        for fight in fights:
+            flag = False
+            for key in ('fighter1', 'fighter2'):
+                name = fight.get(key, '')
+                if name not in cache:
+                    cache[name] = self.is_big_name(name)
+                flag = flag or cache[name]
+            flags.append(flag)
+        return flags
+
+
+_matcher_lock = threading.Lock()
+_matcher_cache = {'signature': None, 'matcher': None}
+
+
 class BigNameFighter(JSONModel):
     """Manage big-name fighters list"""
 
     def __init__(self):
         super().__init__(data_path('big_name_fighters.json'))
 
+    @staticmethod
+    def matcher():
+        """
+        Shared compiled matcher, rebuilt when big_name_fighters.json changes
+        (admin edits in any worker change its mtime).
+        """
+        path = data_path('big_name_fighters.json')
+        try:
+            st = os.stat(path)
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+
+        cached = _matcher_cache
+        if cached['matcher'] is not None and cached['signature'] == signature:
+            return cached['matcher']
+
+        with _matcher_lock:
+            if _matcher_cache['matcher'] is None or _matcher_cache['signature'] != signature:
+                try:
+                    with open(path, 'r') as f:
+                        data = json.load(f)
+                except Exception:
+                    data = []
+                # Entries are {"name": ...} from the admin panel, or plain strings
+                # from the manage-fighters page
+                names = [item if isinstance(item, str) else item.get('name', '') for item in data]
+                matcher = BigNameMatcher(names)
+                matcher.signature = signature
+                _matcher_cache['matcher'] = matcher
+                _matcher_cache['signature'] = signature
+            return _matcher_cache['matcher']
+
+    def save_all(self, data):
+        super().save_all(data)
+        with _matcher_lock:
+            _matcher_cache['matcher'] = None
+
     def is_big_name(self, fighter_name):
         """Check if fighter is in big-name list"""
-        data = self.get_all()
-        fighter_lower = fighter_name.lower()
-        for item in data:
-            if item['name'].lower() in fighter_lower or fighter_lower in item['name'].lower():
-                return True
-        return False
+        return self.matcher().is_big_name(fighter_name)
 
 
 class ManualEvent(JSONModel):
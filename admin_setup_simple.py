@@ -19,11 +19,21 @@ import time
 import json
 import re
 import unicodedata
-import requests as http_requests
+from http_client import http
 from admin_models import FighterImageOverride, BigNameFighter, ManualEvent, TimeOverride, data_path
+from snapshot_store import SnapshotStore
 
 logger = logging.getLogger('fight_schedule')
 
+
+def _load_cached_fights():
+    """Fights from the currently published snapshot generation ([] if none)"""
+    try:
+        cache = SnapshotStore(data_path('snapshots')).load_current()
+    except Exception:
+        return []
+    return cache['fights'] if cache else []
+
 # ============================================================================
 # SECURITY CONFIGURATION
 # ============================================================================
@@ -342,17 +352,8 @@ class MissingFighterImagesView(ProtectedBaseView):
                 fighters_db.update(json.load(f))
         except: pass
 
-        import os
-        cache_path = data_path('fights_cache.json')
-
-        if not os.path.exists(cache_path):
-            return {'missing': {}, 'existing': {}}
-
-        try:
-            with open(cache_path, 'r') as f:
-                cache_data = json.load(f)
-                fights = cache_data.get('fights', [])
-        except Exception:
+        fights = _load_cached_fights()
+        if not fights:
             return {'missing': {}, 'existing': {}}
 
         all_fighters = defaultdict(lambda: {'count': 0, 'sport': '', 'example': '', 'image_url': None})
@@ -418,7 +419,7 @@ def _espn_image_url(name: str) -> str | None:
       https://a.espncdn.com/i/headshots/boxing/players/full/{athlete_id}.png
     """
     try:
-        resp = http_requests.get(
+        resp = http.get(
             'https://site.web.api.espn.com/apis/common/v3/search',
             params={'query': name, 'sport': 'boxing', 'type': 'athlete', 'limit': 5, 'lang': 'en'},
             headers={'User-Agent': _ESPN_UA},
@@ -446,7 +447,7 @@ def _espn_image_url(name: str) -> str | None:
                 img_url = f'https://a.espncdn.com/i/headshots/boxing/players/full/{athlete_id}.png'
 
                 # Verify the image actually exists (ESPN returns a placeholder for unknown athletes)
-                head = http_requests.head(img_url, headers={'User-Agent': _ESPN_UA}, timeout=8)
+                head = http.head(img_url, headers={'User-Agent': _ESPN_UA}, timeout=8)
                 if head.status_code == 200 and int(head.headers.get('content-length', 0)) > 5000:
                     return img_url
     except Exception:
@@ -461,7 +462,7 @@ def _wikipedia_image_url(name: str) -> str | None:
     """
     try:
         # Use the search API first to find the best-matching page title
-        resp = http_requests.get(
+        resp = http.get(
             'https://en.wikipedia.org/w/api.php',
             params={
                 'action': 'query',
@@ -485,7 +486,7 @@ def _wikipedia_image_url(name: str) -> str | None:
 
     for title in candidate_titles[:3]:
         try:
-            resp = http_requests.get(
+            resp = http.get(
                 'https://en.wikipedia.org/w/api.php',
                 params={
                     'action': 'query',
@@ -526,7 +527,7 @@ def _ext_from_url(url: str) -> str:
 
 def _download_image(url: str, dest: str) -> bool:
     try:
-        resp = http_requests.get(url, timeout=15, headers={
+        resp = http.get(url, timeout=15, headers={
             'User-Agent': 'FightScheduleBot/1.0 (https://fightschedule.live)'
         })
         resp.raise_for_status()
@@ -632,19 +633,12 @@ class FetchBoxerImagesView(ProtectedBaseView):
         null_entries   = [k for k, v in db.items() if not v]
         broken_entries = [k for k, v in db.items() if v and _is_broken_local_path(v)]
 
-        cache_path = data_path('fights_cache.json')
         schedule_names = []
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path) as f:
-                    cache = json.load(f)
-                for fight in cache.get('fights', []):
-                    if fight.get('sport') == 'Boxing':
-                        for nm in [fight.get('fighter1'), fight.get('fighter2')]:
-                            if nm and nm != 'TBA':
-                                schedule_names.append(nm)
-            except Exception:
-                pass
+        for fight in _load_cached_fights():
+            if fight.get('sport') == 'Boxing':
+                for nm in [fight.get('fighter1'), fight.get('fighter2')]:
+                    if nm and nm != 'TBA':
+                        schedule_names.append(nm)
 
         missing_from_db = [n for n in schedule_names if n not in db]
         return sorted(set(null_entries + broken_entries + missing_from_db))
@@ -757,6 +751,10 @@ def setup_admin(app):
         """Require authentication for all /admin/* routes defined in app.py"""
         protected_paths = [
             '/admin/clear-cache',
+            '/admin/refresh-status',
+            '/admin/preview-status',
+            '/admin/http-stats',
+            '/admin/snapshots',
             '/admin/upload-images',
             '/admin/manage-fighters',
             '/admin/download-jsons',
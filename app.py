@@ -4,20 +4,40 @@ from dotenv import load_dotenv
 load_dotenv()  # Load environment variables from .env file
 import os
 import shutil
-import unicodedata
-import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 import re
 import logging
+import threading
+import hashlib
+import gzip
+from collections import OrderedDict
+from functools import wraps
 from logging.handlers import RotatingFileHandler
 from admin_setup_simple import setup_admin
 from admin_models import BigNameFighter
+from single_flight import FileLease, SingleFlight
+from snapshot_store import SnapshotStore, SourceCache
+from slug_registry import SlugRegistry
+from fight_ids import assign_ids, ensure_ids, fight_id, override_fight_id, legacy_preview_ids
+from preview_queue import PreviewQueue
+from preview_store import PreviewStore
+from generate_previews import pregenerate_previews
+from preview_client import PreviewClient
+from http_client import http
+from fighter_images import FighterImageIndex
 import markdown
 from bs4 import BeautifulSoup
 
+try:
+    import brotli  # Installed alongside flask-compress
+except ImportError:
+    brotli = None
+
 # Import scrapers
-from scrapers import scrape_ufc_events, scrape_boxing_events
+from scrapers import merge_fights, run_sources
+from scrapers.merge import PROVENANCE_FIELDS
+from scrapers.page_cache import page_cache
 
 # ============================================================================
 # PERSISTENT DATA DIRECTORY
@@ -115,13 +135,6 @@ logger.addHandler(file_handler)
 logger.addHandler(console_handler)
 
 
-def _to_slug(name):
-    """Convert a fighter name to a URL slug, stripping diacritics and punctuation."""
-    normalized = unicodedata.normalize('NFD', name)
-    ascii_name = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-    return ascii_name.lower().replace(' ', '-').replace("'", '').replace('.', '')
-
-
 logger.info("="*70)
 logger.info("FIGHT SCHEDULE APP STARTING")
 logger.info("="*70)
@@ -131,6 +144,16 @@ logger.info("="*70)
 # Anthropic API Key for fight previews
 # ⚠️ ADD YOUR NEW API KEY HERE (after creating it in console.anthropic.com)
 ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY', '')  # Will load from environment variable
+PREVIEW_MODEL = "claude-haiku-4-5-20251001"
+PREVIEW_MAX_TOKENS = 500
+PREVIEW_TOKENS_PER_CALL = PREVIEW_MAX_TOKENS + 400  # Output cap + the ~350-token prompt
+
+# Pooled, retrying, circuit-broken API client shared by every preview path
+preview_client = PreviewClient(
+    ANTHROPIC_API_KEY,
+    PREVIEW_MODEL,
+    max_concurrency=int(os.environ.get('PREVIEW_API_CONCURRENCY', 4)),
+)
 
 # Big-name fighters - always show their fights (even non-title)
 BIG_NAME_FIGHTERS = [
@@ -199,10 +222,20 @@ BIG_NAME_FIGHTERS = [
     'Manny Pacquiao',
 ]
 
-# Cache file path (in persistent data directory)
-CACHE_FILE = data_path('fights_cache.json')
+# Fight cache: numbered snapshot generations in the persistent data directory.
+# The old single-file cache is imported once as the first generation.
+SNAPSHOT_DIR = data_path('snapshots')
+SNAPSHOT_KEEP = int(os.environ.get('SNAPSHOT_KEEP', 5))  # Generations kept for rollback
+LEGACY_CACHE_FILE = data_path('fights_cache.json')
 CACHE_DURATION = timedelta(hours=6)  # Refresh every 6 hours
 
+snapshot_store = SnapshotStore(SNAPSHOT_DIR, keep=SNAPSHOT_KEEP)
+snapshot_store.import_legacy(LEGACY_CACHE_FILE)
+
+# Each scraper source's last successful result, reused when that source fails
+SOURCE_LAST_GOOD_MAX_AGE = timedelta(hours=72)
+source_cache = SourceCache(data_path('sources'))
+
 def format_fight_date(date_str):
     """Format date from YYYY-MM-DD to 'Sat, Dec 06'"""
     if not date_str:
@@ -238,52 +271,29 @@ def format_fight_time(time_str):
 app.jinja_env.filters['format_date'] = format_fight_date
 app.jinja_env.filters['format_time'] = format_fight_time
 
-def load_fighter_database():
-    """Load fighters.json and fighters_ufc.json from persistent data directory"""
-    fighters_db = {}
-
-    # Load general fighter database (from TheSportsDB)
-    try:
-        with open(data_path('fighters.json'), 'r', encoding='utf-8') as f:
-            fighters_db.update(json.load(f))
-    except:
-        pass
-
-    # Load UFC-specific database (from UFC.com scraper)
-    try:
-        with open(data_path('fighters_ufc.json'), 'r', encoding='utf-8') as f:
-            ufc_db = json.load(f)
-            # UFC database takes priority for UFC fighters
-            fighters_db.update(ufc_db)
-    except:
-        pass
-
-    return fighters_db
+# Fighter images: one cached index over fighters.json, fighters_ufc.json and
+# the admin image overrides, rebuilt only when one of those files changes.
+fighter_image_index = FighterImageIndex(
+    data_path('fighters.json'),
+    data_path('fighters_ufc.json'),
+    data_path('fighter_image_overrides.json'),
+)
 
 def get_fighter_image(fighter_name):
     """Search for fighter by name and return their image URL"""
-    if not fighter_name or fighter_name == 'TBA':
-        return None
-    
-    # Check local database only (no API fallback)
-    fighters_db = load_fighter_database()
-    if fighter_name in fighters_db:
-        cached_url = fighters_db[fighter_name]
-        if cached_url:
-            print(f"Using cached image for {fighter_name}")
-            return cached_url
-    
-    return None
+    return fighter_image_index.lookup(fighter_name)
 
 # ============================================================================
 # AI FIGHT PREVIEW FUNCTIONS
 # ============================================================================
+# Previews live in SQLite (see preview_store.py); fight_previews.json is only
+# read once to migrate older deployments.
+preview_store = PreviewStore(data_path('fight_previews.sqlite3'), legacy_json_path=data_path('fight_previews.json'))
 
 def load_previews():
-    """Load cached fight previews from persistent data directory"""
+    """Load all cached fight previews (admin/debug use - pages do point lookups)"""
     try:
-        with open(data_path('fight_previews.json'), 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return preview_store.all()
     except Exception as e:
         logger.warning(f"Could not load previews: {e}")
         return {}
@@ -300,10 +310,7 @@ def save_preview(preview_id, preview_data):
                 # Fallback if not valid JSON
                 pass
         
-        previews = load_previews()
-        previews[preview_id] = preview_data
-        with open(data_path('fight_previews.json'), 'w', encoding='utf-8') as f:
-            json.dump(previews, f, indent=2, ensure_ascii=False)
+        preview_store.put(preview_id, preview_data)
         logger.info(f"Saved preview: {preview_id}")
     except Exception as e:
         logger.error(f"Failed to save preview: {e}")
@@ -361,49 +368,74 @@ Example good output:
   "what_to_watch": "Watch the opening two rounds—whoever controls distance there wins the mental battle. If Merab clinches early, it's a grind. If Yan stays at range, it's a striking clinic."
 }}"""
 
+    logger.info(f"Generating preview for {fighter1} vs {fighter2}...")
+    
+    preview_text = preview_client.complete(prompt, PREVIEW_MAX_TOKENS)
+    if preview_text is None:
+        return None
+    
+    # Strip markdown code blocks if present
+    preview_text = preview_text.replace('```json', '').replace('```', '').strip()
+    logger.info("Preview generated successfully")
+    return preview_text
+
+def get_cached_preview(preview_id, legacy_ids=()):
+    """
+    Cached preview or None - never calls the API.
+
+    preview_id is the headline's fight_id. A preview stored under one of
+    legacy_ids (event slug / name-slug keys) is moved to it instead of
+    paying for a new generation.
+    """
     try:
-        logger.info(f"Generating preview for {fighter1} vs {fighter2}...")
-        
-        response = requests.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                "Content-Type": "application/json",
-                "x-api-key": ANTHROPIC_API_KEY,
-                "anthropic-version": "2023-06-01"
-            },
-            json={
-                "model": "claude-haiku-4-5-20251001",
-                "max_tokens": 500,
-                "messages": [{"role": "user", "content": prompt}]
-            },
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            preview_text = response.json()['content'][0]['text']
-            # Strip markdown code blocks if present
-            preview_text = preview_text.replace('```json', '').replace('```', '').strip()
-            logger.info("Preview generated successfully")
-            return preview_text
-        else:
-            logger.error(f"API request failed: {response.status_code}")
-            return None
-            
+        found_id, preview = preview_store.get_first((preview_id, *legacy_ids))
     except Exception as e:
-        logger.error(f"Preview generation error: {e}")
+        logger.warning(f"Could not read preview {preview_id}: {e}")
         return None
-
-def get_or_generate_preview(preview_id, fighter1, fighter2, sport, is_title, weight_class=None):
-    """Get cached preview or generate new one"""
-    
-    # Check cache first
-    previews = load_previews()
     
-    if preview_id in previews:
+    if found_id == preview_id:
         logger.info(f"Using cached preview for {preview_id}")
-        return previews[preview_id]
-    
-    # Generate new preview
+    elif preview is not None:
+        logger.info(f"Migrating preview {found_id} -> {preview_id}")
+        save_preview(preview_id, preview)
+    return preview
+
+# One generation per preview_id at a time: threads in this worker share the
+# leader's result, and other workers wait on a per-preview file lease and
+# then read what the holder saved instead of calling the API again.
+PREVIEW_LOCK_DIR = data_path('preview_locks')
+PREVIEW_LEASE_WAIT = 60  # Seconds to wait for another worker's generation
+_preview_flights = SingleFlight()
+
+def _generate_and_save_preview(preview_id, fighter1, fighter2, sport, is_title, weight_class=None):
+    """Generate and persist a preview unless someone else already is; returns it or None"""
+    preview, shared = _preview_flights.do(
+        preview_id, _generate_preview_once, preview_id, fighter1, fighter2, sport, is_title, weight_class
+    )
+    if shared:
+        logger.info(f"Reused in-flight preview generation for {preview_id}")
+    return preview
+
+def _generate_preview_once(preview_id, fighter1, fighter2, sport, is_title, weight_class=None):
+    """Cross-worker leader for one preview_id (runs once per process at a time)"""
+    lock_name = re.sub(r'[^A-Za-z0-9_-]', '_', preview_id)
+    lease = FileLease(os.path.join(PREVIEW_LOCK_DIR, f'{lock_name}.lock'), ttl=120)
+    acquired = lease.acquire(timeout=PREVIEW_LEASE_WAIT, poll_interval=0.5)
+    try:
+        # Another worker may have saved it while we waited for the lease
+        existing = preview_store.get(preview_id)
+        if existing is not None:
+            logger.info(f"Preview {preview_id} was generated by another worker")
+            return existing
+        if not acquired:
+            logger.warning(f"Timed out waiting for another worker to generate {preview_id}")
+            return None
+        return _call_api_and_save(preview_id, fighter1, fighter2, sport, is_title, weight_class)
+    finally:
+        lease.release()
+
+def _call_api_and_save(preview_id, fighter1, fighter2, sport, is_title, weight_class=None):
+    """Call the API and persist the result; returns the preview or None"""
     preview_text = generate_fight_preview(fighter1, fighter2, sport, is_title, weight_class)
     
     if preview_text:
@@ -419,7 +451,84 @@ def get_or_generate_preview(preview_id, fighter1, fighter2, sport, is_title, wei
     
     return None
 
+# Page requests only ever read the cache; misses are generated here in the
+# background and picked up by the page's placeholder via /api/preview/<id>
+preview_queue = PreviewQueue(_generate_and_save_preview, workers=int(os.environ.get('PREVIEW_WORKERS', 2)))
+
+def preview_job(fight):
+    """_generate_and_save_preview() arguments for an event's headline fight"""
+    if fight.get('sport') == 'UFC':
+        return {
+            'fighter1': fight['fighter1'],
+            'fighter2': fight['fighter2'],
+            'sport': 'UFC',
+            'is_title': fight.get('weight_class') == 'Title',
+            'weight_class': None,  # UFC doesn't extract weight classes
+        }
+    return {
+        'fighter1': fight['fighter1'],
+        'fighter2': fight['fighter2'],
+        'sport': 'Boxing',
+        'is_title': 'Title' in (fight.get('weight_class') or ''),
+        'weight_class': fight.get('weight_class'),
+    }
+
+def request_preview(fight, legacy_ids=()):
+    """Cached preview for a headline fight, or None after queueing its generation"""
+    preview_id = fight_id(fight)
+    cached = get_cached_preview(preview_id, legacy_ids)
+    if cached:
+        return cached
+    preview_queue.submit(preview_id, **preview_job(fight))
+    return None
+
+# ============================================================================
+# PREVIEW PRE-GENERATION
+# ============================================================================
+# After each successful refresh one worker walks every upcoming headline
+# (best featuring score first) and fills in missing previews within
+# PREVIEW_PREGEN_TOKEN_BUDGET, so visitors rarely see the placeholder.
+PREGEN_LOCK_FILE = data_path('preview_pregen.lock')
+
+def run_preview_pregeneration():
+    """Pre-generate previews for the current snapshot; None if skipped"""
+    if not ANTHROPIC_API_KEY:
+        logger.info("No Anthropic API key set - skipping preview pre-generation")
+        return None
+
+    lease = FileLease(PREGEN_LOCK_FILE, ttl=3600)
+    if not lease.acquire():
+        logger.info("Preview pre-generation already running in another worker")
+        return None
+    try:
+        snapshot = get_fight_snapshot()
+        return pregenerate_previews(
+            snapshot.fights,
+            get_slug_registry(snapshot),
+            score=score_fight_for_featuring,
+            get_cached=get_cached_preview,
+            generate=_generate_and_save_preview,
+            job_for=preview_job,
+            tokens_per_preview=PREVIEW_TOKENS_PER_CALL,
+        )
+    except Exception as e:
+        logger.error(f"Preview pre-generation failed: {e}", exc_info=True)
+        return None
+    finally:
+        lease.release()
+
+def trigger_preview_pregeneration():
+    """Run pre-generation in a daemon thread"""
+    threading.Thread(target=run_preview_pregeneration, name='preview-pregen', daemon=True).start()
+
+# ============================================================================
+# MANUAL TIME OVERRIDES
 # ============================================================================
+# Admin-entered times live in time_overrides.json keyed "F1 vs F2|YYYY-MM-DD".
+# The file is indexed by fight_id once per change and merged into the
+# in-memory snapshot when that is built, so requests never re-read or re-apply
+# it. Snapshots on disk keep the scraped times; removing an override restores them.
+
 
 def load_time_overrides():
     """Load manual time overrides from persistent data directory"""
@@ -429,44 +538,84 @@ def load_time_overrides():
     except FileNotFoundError:
         return {}
     except Exception as e:
-        print(f"Error loading time overrides: {e}")
+        logger.error(f"Error loading time overrides: {e}")
         return {}
 
-def get_fight_key(fight):
-    """Generate unique key for a fight (used for time overrides)"""
-    return f"{fight['fighter1']} vs {fight['fighter2']}|{fight['date']}"
+
+class TimeOverrideTable:
+    """time_overrides.json indexed by fight_id"""
+
+    def __init__(self, overrides, signature=None):
+        self.signature = signature
+        self._times = {}
+        for fight_key, time in overrides.items():
+            key = override_fight_id(fight_key)
+            if key is None:
+                logger.warning(f"Ignoring malformed time override key: {fight_key!r}")
+                continue
+            self._times[key] = time
+
+    def __len__(self):
+        return len(self._times)
+
+    def time_for(self, fight):
+        """Override time for a fight, or None"""
+        if not self._times:
+            return None
+        return self._times.get(fight_id(fight))
+
+    def apply(self, fights):
+        """
+        Merge overrides into a fight list.
+
+        Returns:
+            (fights, applied): a new list in which overridden fights are copies;
+            all other fight dicts are shared with the input
+        """
+        if not self._times:
+            return list(fights), 0
+        merged = []
+        applied = 0
+        for fight in fights:
+            time = self.time_for(fight)
+            if time is not None and time != fight.get('time'):
+                fight = dict(fight, time=time)
+                applied += 1
+            merged.append(fight)
+        return merged, applied
+
+
+_override_table = None
+_override_table_lock = threading.Lock()
+
+
+def get_time_override_table():
+    """Process-wide override table, re-indexed only when the file changes"""
+    global _override_table
+    signature = _file_signature(data_path('time_overrides.json'))
+    table = _override_table
+    if table is not None and table.signature == signature:
+        return table
+
+    with _override_table_lock:
+        if _override_table is None or _override_table.signature != signature:
+            _override_table = TimeOverrideTable(load_time_overrides(), signature)
+        return _override_table
+
 
 def apply_time_overrides(fights):
-    """Apply manual time overrides to fights"""
-    overrides = load_time_overrides()
-    
-    if not overrides:
-        return fights
-    
-    applied_count = 0
-    for fight in fights:
-        fight_key = get_fight_key(fight)
-        if fight_key in overrides:
-            old_time = fight.get('time', 'TBA')
-            fight['time'] = overrides[fight_key]
-            print(f"Time override applied: {fight['fighter1']} vs {fight['fighter2']}: {old_time} → {fight['time']}")
-            applied_count += 1
-    
-    if applied_count > 0:
-        print(f"\n✓ Applied {applied_count} manual time override(s)\n")
-    
-    return fights
+    """Apply manual time overrides to fights (returns a new list)"""
+    merged, applied = get_time_override_table().apply(fights)
+    if applied:
+        logger.info(f"Applied {applied} manual time override(s)")
+    return merged
 
 def is_big_name_fight(fight):
     """Check if fight involves a big-name fighter"""
-    model = BigNameFighter()
-    fighter1 = fight.get('fighter1', '')
-    fighter2 = fight.get('fighter2', '')
-
-    return model.is_big_name(fighter1) or model.is_big_name(fighter2)
+    return BigNameFighter.matcher().is_big_name_fight(fight)
 
 
-def score_fight_for_featuring(fight, today_date):
+def score_fight_for_featuring(fight, today_date, big_name=None):
     """
     Score a fight for the Featured section. Higher = more prominent.
 
@@ -476,6 +625,8 @@ def score_fight_for_featuring(fight, today_date):
       +20  Main event / main card
       +10  Has confirmed (non-estimated) time
       +5   Per day closer (max 7 days out = +35 for today, +5 for 7 days away)
+
+    Pass big_name when it was already computed in bulk (BigNameMatcher.classify).
     """
     score = 0
 
@@ -485,7 +636,9 @@ def score_fight_for_featuring(fight, today_date):
         score += 50
 
     # Big-name fighter
-    if is_big_name_fight(fight):
+    if big_name is None:
+        big_name = is_big_name_fight(fight)
+    if big_name:
         score += 30
 
     # Main event / main card
@@ -509,68 +662,324 @@ def score_fight_for_featuring(fight, today_date):
 
     return score
 
+# ============================================================================
+# IN-MEMORY FIGHT SNAPSHOT
+# ============================================================================
+# Every public route needs the full fight list. Instead of parsing the cache
+# on each request, each worker keeps one parsed snapshot in memory and only
+# re-reads it when the store's CURRENT pointer changes (a new generation was
+# published) or the in-process counter bumped by save_cache changes. An edit
+# to time_overrides.json only re-merges the overrides into the parsed base.
+
+_snapshot = None
+_base_snapshot = None  # As published, before time overrides
+_snapshot_lock = threading.Lock()
+_cache_generation = 0
+
+
+class FightSnapshot:
+    """Immutable parsed copy of the fights cache, with time overrides applied"""
+
+    __slots__ = ('fights', 'timestamp', 'generation', 'signature')
+
+    def __init__(self, fights, timestamp, generation, signature):
+        self.fights = tuple(fights)
+        self.timestamp = timestamp
+        self.generation = generation
+        self.signature = signature
+
+    def age(self):
+        """Age of the cached data as a timedelta (None if there is no cache)"""
+        if self.timestamp is None:
+            return None
+        return datetime.now() - self.timestamp
+
+    def copy_fights(self):
+        """Return per-request copies so callers can't mutate the snapshot"""
+        return [dict(f) for f in self.fights]
+
+
+def _file_signature(path):
+    """(mtime_ns, size) of a file, or None if it doesn't exist"""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _current_snapshot_signature():
+    return (
+        _cache_generation,
+        _file_signature(snapshot_store.current_path),
+        _file_signature(data_path('time_overrides.json')),
+    )
+
+
+def _load_base_snapshot(signature):
+    """
+    Load the published generation into a FightSnapshot (empty on failure).
+    A corrupt current generation falls back to the newest readable one.
+    """
+    try:
+        cache_data = snapshot_store.load_current()
+    except Exception as e:
+        logger.error(f"Error loading cache: {e}")
+        cache_data = None
+
+    if cache_data is None:
+        logger.debug("No published snapshot found")
+        return FightSnapshot([], None, None, signature)
+
+    cache_time = cache_data['timestamp']
+    fights = ensure_ids(cache_data['fights'])
+    logger.info(f"Snapshot generation {cache_data['generation']} loaded: {len(fights)} fights from {cache_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    return FightSnapshot(fights, cache_time, cache_data['generation'], signature)
+
+
+def _load_snapshot(signature):
+    """Published snapshot with time overrides merged in (caller holds _snapshot_lock)"""
+    global _base_snapshot
+    base_signature = signature[:2]
+    if _base_snapshot is None or _base_snapshot.signature != base_signature:
+        _base_snapshot = _load_base_snapshot(base_signature)
+    base = _base_snapshot
+    return FightSnapshot(apply_time_overrides(base.fights), base.timestamp, base.generation, signature)
+
+
+def get_fight_snapshot():
+    """Return the process-wide snapshot, reloading it only if the cache changed"""
+    global _snapshot
+    signature = _current_snapshot_signature()
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.signature == signature:
+        return snapshot
+
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.signature != signature:
+            _snapshot = _load_snapshot(signature)
+        return _snapshot
+
+
 def load_cache(max_age_hours=None):
     """
     Load cached fight data if it exists and is fresh
     
     Args:
-        max_age_hours: If provided, accept cache up to this many hours old (for fallback scenarios)
+        max_age_hours: If provided, accept cache up to this many hours old (for fallback scenarios).
+            The in-memory snapshot always holds the last good generation, so the
+            fallback never re-reads a possibly half-written file.
     """
-    if not os.path.exists(CACHE_FILE):
-        logger.debug("No cache file found")
+    snapshot = get_fight_snapshot()
+    if snapshot.timestamp is None:
         return None
-    
-    try:
-        with open(CACHE_FILE, 'r') as f:
-            cache_data = json.load(f)
-            
-        # Check if cache is still fresh
-        cache_time = datetime.fromisoformat(cache_data['timestamp'])
-        age = datetime.now() - cache_time
-        
-        # Use custom max age if provided (for fallback), otherwise use default CACHE_DURATION
-        max_age = timedelta(hours=max_age_hours) if max_age_hours else CACHE_DURATION
-        
-        if age < max_age:
-            if max_age_hours:
-                logger.warning(f"[FALLBACK] Using stale cache from {cache_time.strftime('%Y-%m-%d %H:%M:%S')} (age: {age.seconds//3600} hours)")
-            else:
-                logger.info(f"[OK] Using cached data from {cache_time.strftime('%Y-%m-%d %H:%M:%S')} (age: {age.seconds//60} minutes)")
-            
-            # Apply time overrides to cached data
-            fights = cache_data['fights']
-            fights = apply_time_overrides(fights)
-            
-            logger.info(f"  Loaded {len(fights)} fights from cache")
-            return fights
+
+    age = snapshot.age()
+    cache_time = snapshot.timestamp
+
+    # Use custom max age if provided (for fallback), otherwise use default CACHE_DURATION
+    max_age = timedelta(hours=max_age_hours) if max_age_hours else CACHE_DURATION
+
+    if age < max_age:
+        if max_age_hours:
+            logger.warning(f"[FALLBACK] Using stale cache from {cache_time.strftime('%Y-%m-%d %H:%M:%S')} (age: {age.seconds//3600} hours)")
         else:
-            logger.info(f"[X] Cache expired (age: {age.seconds//3600} hours), fetching new data...")
-            return None
-    except Exception as e:
-        logger.error(f"Error loading cache: {e}")
+            logger.debug(f"[OK] Using cached data from {cache_time.strftime('%Y-%m-%d %H:%M:%S')} (age: {age.seconds//60} minutes)")
+        return snapshot.copy_fights()
+    else:
+        logger.info(f"[X] Cache expired (age: {age.seconds//3600} hours), fetching new data...")
         return None
 
+def invalidate_snapshot():
+    """Force every caller in this process to re-read the cache on next access"""
+    global _cache_generation
+    with _snapshot_lock:
+        _cache_generation += 1
+
 def save_cache(fights):
-    """Save fight data to cache with timestamp"""
+    """Save fight data to cache as a new snapshot generation"""
     try:
-        cache_data = {
-            'timestamp': datetime.now().isoformat(),
-            'fights': fights
-        }
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache_data, f)
-        logger.info(f"[OK] Cache saved: {len(fights)} fights at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        generation = snapshot_store.write(fights)
+        invalidate_snapshot()
+        logger.info(f"[OK] Cache saved: {len(fights)} fights as generation {generation} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     except Exception as e:
         logger.error(f"Error saving cache: {e}")
 
 
+# ============================================================================
+# STALE-WHILE-REVALIDATE REFRESH
+# ============================================================================
+# REFRESH_MODE=background (default): once the snapshot is older than
+# CACHE_DURATION we keep serving it and scrape in a daemon thread, so no page
+# request ever waits on the scrapers. REFRESH_MODE=inline restores the old
+# behaviour of scraping inside the request. A cold start with no cache at all
+# always scrapes inline since there is nothing to serve yet.
+REFRESH_MODE = os.environ.get('REFRESH_MODE', 'background')
+REFRESH_RETRY_AFTER = timedelta(minutes=10)  # Back off after a failed refresh
+REFRESH_BUSY_RETRY_AFTER = timedelta(seconds=30)  # Another worker holds the lease
+# Past this age (scrapers broken for days) only fights that haven't happened
+# yet are served, so pages never list past fights as upcoming
+SNAPSHOT_MAX_STALE = timedelta(hours=int(os.environ.get('SNAPSHOT_MAX_STALE_HOURS', 72)))
+
+# Only one worker scrapes at a time; the lease lives next to the cache so
+# every gunicorn worker on the box sees it.
+REFRESH_LOCK_FILE = data_path('fights_refresh.lock')
+REFRESH_WAIT_SECONDS = 30  # Cold start: how long to wait for another worker's scrape
+SCRAPE_DEADLINE_SECONDS = int(os.environ.get('SCRAPE_DEADLINE_SECONDS', 90))  # All sources together
+
+_refresh_lock = threading.Lock()
+_refresh_state = {
+    'running': False,
+    'started_at': None,
+    'finished_at': None,
+    'last_success_at': None,
+    'last_result': None,   # 'ok' | 'partial' | 'failed' | 'busy' | 'error'
+    'last_error': None,
+    'sources': None,       # Per-source outcome of the last scrape
+}
+
+
+def _refresh_worker():
+    """Background thread body: scrape, save, and record the outcome"""
+    try:
+        fights, result = refresh_fights()
+        error = 'Scraper validation failed' if result == 'failed' else None
+    except Exception as e:
+        logger.error(f"Background refresh crashed: {e}", exc_info=True)
+        result, error = 'error', str(e)
+
+    with _refresh_lock:
+        now = datetime.now()
+        _refresh_state['running'] = False
+        _refresh_state['finished_at'] = now
+        _refresh_state['last_result'] = result
+        _refresh_state['last_error'] = error
+        if result in ('ok', 'partial'):
+            _refresh_state['last_success_at'] = now
+
+
+def trigger_background_refresh():
+    """Start a background refresh unless one is running or recently failed"""
+    with _refresh_lock:
+        if _refresh_state['running']:
+            return False
+        finished_at = _refresh_state['finished_at']
+        last_result = _refresh_state['last_result']
+        if finished_at:
+            since = datetime.now() - finished_at
+            if last_result in ('failed', 'error') and since < REFRESH_RETRY_AFTER:
+                return False
+            if last_result == 'busy' and since < REFRESH_BUSY_RETRY_AFTER:
+                return False
+        _refresh_state['running'] = True
+        _refresh_state['started_at'] = datetime.now()
+
+    logger.info("Snapshot stale - starting background refresh")
+    threading.Thread(target=_refresh_worker, name='fights-refresh', daemon=True).start()
+    return True
+
+
+def get_refresh_status():
+    """Snapshot age and background refresh state, for monitoring"""
+    snapshot = get_fight_snapshot()
+    age = snapshot.age()
+    with _refresh_lock:
+        state = dict(_refresh_state)
+    for key in ('started_at', 'finished_at', 'last_success_at'):
+        if state[key]:
+            state[key] = state[key].isoformat()
+    return {
+        'mode': REFRESH_MODE,
+        'snapshot_generation': snapshot.generation,
+        'snapshot_timestamp': snapshot.timestamp.isoformat() if snapshot.timestamp else None,
+        'snapshot_age_seconds': int(age.total_seconds()) if age is not None else None,
+        'snapshot_fights': len(snapshot.fights),
+        'stale': age is None or age >= CACHE_DURATION,
+        'expired': age is not None and age >= SNAPSHOT_MAX_STALE,
+        'refresh': state,
+    }
+
+
+_upcoming_snapshot = None
+
+
+def _upcoming_only(snapshot):
+    """The snapshot without fights dated before today (built once per snapshot and day)"""
+    global _upcoming_snapshot
+    from datetime import date as date_cls
+    today = date_cls.today().isoformat()
+    signature = (snapshot.signature, 'upcoming', today)
+    upcoming = _upcoming_snapshot
+    if upcoming is not None and upcoming.signature == signature:
+        return upcoming
+
+    fights = [f for f in snapshot.fights if f.get('date', '') >= today]
+    logger.warning(f"Snapshot older than {SNAPSHOT_MAX_STALE} - serving {len(fights)} of "
+                   f"{len(snapshot.fights)} fights (past dates dropped)")
+    upcoming = FightSnapshot(fights, snapshot.timestamp, snapshot.generation, signature)
+    _upcoming_snapshot = upcoming
+    return upcoming
+
+
+def current_snapshot():
+    """Snapshot to serve for this request, refreshing it if it has expired"""
+    snapshot = get_fight_snapshot()
+    age = snapshot.age()
+
+    if age is not None and age < CACHE_DURATION:
+        return snapshot
+
+    if age is not None and REFRESH_MODE == 'background':
+        # Serve the last good snapshot while a background thread refreshes it
+        trigger_background_refresh()
+    else:
+        logger.info("No usable cache - refreshing inline")
+        refresh_fights(wait=REFRESH_WAIT_SECONDS)
+        snapshot = get_fight_snapshot()
+        age = snapshot.age()
+
+    if age is not None and age >= SNAPSHOT_MAX_STALE:
+        return _upcoming_only(snapshot)
+    return snapshot
+
+
 def fetch_fights():
     """Fetch upcoming UFC and Boxing fights from multiple sources"""
-    # Try loading from cache first
-    cached_fights = load_cache()
-    if cached_fights is not None:
-        return cached_fights
-    
+    return current_snapshot().copy_fights()
+
+
+def refresh_fights(wait=0):
+    """
+    Refresh the fights cache, with at most one worker scraping at a time.
+
+    Args:
+        wait: Seconds to wait for another worker's refresh before giving up
+
+    Returns:
+        (fights, status): status is 'ok' when the cache is fresh afterwards,
+        'partial' when it was saved with last-good data for failing sources,
+        'failed' when a source failed with no last-good data (fights then come
+        from the stale fallback cache) and 'busy' when another worker holds the lease.
+    """
+    lease = FileLease(REFRESH_LOCK_FILE)
+    if not lease.acquire(timeout=wait):
+        logger.info("Another worker is refreshing fights - serving current snapshot")
+        return get_fight_snapshot().copy_fights(), 'busy'
+
+    try:
+        # Another worker may have finished a refresh while we waited
+        snapshot = get_fight_snapshot()
+        age = snapshot.age()
+        if age is not None and age < CACHE_DURATION:
+            logger.info("Cache already refreshed by another worker")
+            return snapshot.copy_fights(), 'ok'
+        return _scrape_fights()
+    finally:
+        lease.release()
+
+
+def _scrape_fights():
+    """Scrape every source, validate, and save a new cache (lease must be held)"""
     # Open debug log file
     debug_log = open('data_sources_comparison.txt', 'w', encoding='utf-8')
     
@@ -579,74 +988,80 @@ def fetch_fights():
         print(message)
         debug_log.write(message + '\n')
     
-    # If no cache, fetch fresh data
-    fights = []
-    
     log("\n" + "="*60)
     log("FIGHT DATA SOURCES COMPARISON")
     log("="*60 + "\n")
     
-    # 1. Scrape BoxingSchedule.co for boxing
-    log("--- BOXINGSCHEDULE.CO ---")
-    boxingschedule_fights = scrape_boxing_events()
-    log(f"BoxingSchedule.co found: {len(boxingschedule_fights)} fights\n")
-    for fight in boxingschedule_fights[:5]:
-        log(f"  • {fight['fighter1']} vs {fight['fighter2']} - {fight['date']} {'[MAIN]' if fight.get('is_main_event') else ''}")
-    if len(boxingschedule_fights) > 5:
-        log(f"  ... and {len(boxingschedule_fights) - 5} more\n")
-    
-    # 1b. Scrape BBC Sport for boxing (DISABLED FOR TESTING)
-    log("--- BBC SPORT BOXING (DISABLED) ---")
-    # bbc_boxing = scrape_bbc_boxing()
-    bbc_boxing = []
-    log(f"BBC Sport Boxing: DISABLED\n")
-    
-    # 2. Scrape MMA Fighting for UFC schedule
-    log("\n--- MMA FIGHTING UFC ---")
-    mma_fighting_ufc = scrape_ufc_events()
-    log(f"MMA Fighting UFC found: {len(mma_fighting_ufc)} fights\n")
-    for fight in mma_fighting_ufc[:5]:
-        log(f"  • {fight['fighter1']} vs {fight['fighter2']} - {fight['date']} - {fight['venue']}")
-    if len(mma_fighting_ufc) > 5:
-        log(f"  ... and {len(mma_fighting_ufc) - 5} more\n")
-    
-    # 3. Fetch TheSportsDB for boxing images (DISABLED - poor data quality)
-    log("\n--- THESPORTSDB BOXING (DISABLED) ---")
-    # thesportsdb_boxing = fetch_boxing_events()
-    thesportsdb_boxing = []
-    log(f"TheSportsDB Boxing: DISABLED\n")
-    
-    # 4. Combine data
+    # 1. Run every registered source in parallel (see scrapers/__init__.py)
+    results = run_sources(deadline=SCRAPE_DEADLINE_SECONDS)
+    for result in results:
+        source = result.source
+        log(f"--- {source.label.upper()} ({source.sport}) ---")
+        if result.status in ('error', 'timeout'):
+            log(f"{source.label}: {result.status.upper()} after {result.elapsed:.1f}s - {result.error}\n")
+            continue
+        log(f"{source.label} found: {len(result.fights)} fights in {result.elapsed:.1f}s\n")
+        for fight in result.fights[:5]:
+            log(f"  • {fight['fighter1']} vs {fight['fighter2']} - {fight['date']} - {fight.get('venue', '')} {'[MAIN]' if fight.get('is_main_event') else ''}")
+        if len(result.fights) > 5:
+            log(f"  ... and {len(result.fights) - 5} more\n")
+    
+    # 2. Combine data: fresh fights from healthy sources, each failing
+    #    source's last good result (up to SOURCE_LAST_GOOD_MAX_AGE old),
+    #    merged so a fight listed by several sources appears once
     log("\n" + "="*60)
     log("MERGING DATA...")
     log("="*60 + "\n")
     
-    # Add BoxingSchedule.co fights
-    fights.extend(boxingschedule_fights)
+    source_status = []
+    source_fights = []
+    stale_sources = []
+    failure_reasons = []
+    for result in results:
+        source = result.source
+        status = result.describe()
+        source_status.append(status)
+        if result.ok:
+            source_fights.append((source.name, result.fights))
+            try:
+                source_cache.save(source.name, result.fights)
+            except Exception as e:
+                logger.warning(f"Could not save last-good cache for {source.name}: {e}")
+            continue
+        
+        if result.status == 'too_few':
+            reason = f"{source.label}: Only {len(result.fights)} fights (expected {source.min_fights}+)"
+        else:
+            reason = f"{source.label}: {result.status} ({result.error})"
+        logger.error(f"SCRAPER FAILURE: {reason}")
+        
+        last_good = source_cache.load(source.name, max_age=SOURCE_LAST_GOOD_MAX_AGE)
+        if last_good:
+            log(f"⚠️  {reason} - using last good result from {last_good['timestamp'].strftime('%Y-%m-%d %H:%M')} ({len(last_good['fights'])} fights)")
+            source_fights.append((source.name, last_good['fights']))
+            stale_sources.append(source.label)
+            status['used_last_good'] = last_good['timestamp'].isoformat()
+        else:
+            log(f"❌ {reason} - no last good result available")
+            failure_reasons.append(reason)
     
-    # Add BBC Sport boxing fights
-    fights.extend(bbc_boxing)
+    # Same fight from several sources (or listed twice) -> one record
+    fights = merge_fights(source_fights)
+    listed = sum(len(f) for _, f in source_fights)
+    if listed != len(fights):
+        log(f"Merged {listed} listings into {len(fights)} fights ({listed - len(fights)} duplicates)")
     
-    # Add MMA Fighting UFC fights
-    fights.extend(mma_fighting_ufc)
+    with _refresh_lock:
+        _refresh_state['sources'] = source_status
     
-    # VALIDATION: Check if scrapers failed
-    ufc_count = len(mma_fighting_ufc)
-    boxing_count = len(boxingschedule_fights)
+    # VALIDATION: every source must be covered by fresh or last-good data
+    ufc_count = sum(1 for f in fights if f.get('sport') == 'UFC')
+    boxing_count = sum(1 for f in fights if f.get('sport') == 'Boxing')
     total_count = len(fights)
     
-    scraper_failed = False
-    failure_reasons = []
-    
     if total_count == 0:
-        scraper_failed = True
-        failure_reasons.append("CRITICAL: No fights scraped at all")
-    elif ufc_count < 10:
-        scraper_failed = True
-        failure_reasons.append(f"UFC scraper: Only {ufc_count} fights (expected 50+)")
-    elif boxing_count < 5:
-        scraper_failed = True
-        failure_reasons.append(f"Boxing scraper: Only {boxing_count} fights (expected 10+)")
+        failure_reasons.insert(0, "CRITICAL: No fights scraped at all")
+    scraper_failed = bool(failure_reasons)
     
     if scraper_failed:
         log("\n" + "="*60)
@@ -663,35 +1078,24 @@ def fetch_fights():
         log("="*60 + "\n")
         
         # Return old cache instead
-        debug_log.close()
-        
         old_cache = load_cache(max_age_hours=72)  # Accept up to 3-day old cache
-        if old_cache:
-            return old_cache
-        else:
+        if not old_cache:
             log("❌ No old cache available - returning empty results")
-            return []
+        debug_log.close()
+        return old_cache or [], 'failed'
     
     log(f"\n✓ Validation passed: UFC={ufc_count}, Boxing={boxing_count}, Total={total_count}\n")
+    if stale_sources:
+        log(f"⚠️  Using last good data for: {', '.join(stale_sources)}\n")
     
-    # TheSportsDB merge disabled
-    merged_count = 0
-    new_from_tsd = 0
-    
-    # 5. Fetch images for fights that don't have them yet
+    # 3. Fetch images for fights that don't have them yet
     log("\n--- FETCHING MISSING FIGHTER IMAGES ---\n")
     images_fetched = 0
+    # Admin overrides are applied when pages render, never stored in the snapshot
     for fight in fights:
-        if not fight.get('fighter1_image'):
-            img = get_fighter_image(fight['fighter1'])
-            if img:
-                fight['fighter1_image'] = img
-                images_fetched += 1
-        if not fight.get('fighter2_image'):
-            img = get_fighter_image(fight['fighter2'])
-            if img:
-                fight['fighter2_image'] = img
-                images_fetched += 1
+        had_images = bool(fight.get('fighter1_image')) + bool(fight.get('fighter2_image'))
+        fighter_image_index.fill(fight, overrides=False)
+        images_fetched += bool(fight.get('fighter1_image')) + bool(fight.get('fighter2_image')) - had_images
     
     log(f"Fetched {images_fetched} additional fighter images")
     
@@ -718,14 +1122,15 @@ def fetch_fights():
     debug_log.close()
     print("\n✓ Debug comparison saved to: data_sources_comparison.txt\n")
     
-    # Apply manual time overrides
-    fights = apply_time_overrides(fights)
+    # Stable IDs every later join (overrides, previews, slugs) keys on
+    assign_ids(fights)
     
-    # Save to cache
+    # Save to cache (time overrides are merged when the snapshot is loaded)
     if fights:
         save_cache(fights)
+        trigger_preview_pregeneration()
     
-    return fights
+    return apply_time_overrides(fights), ('partial' if stale_sources else 'ok')
 
 @app.route('/persisted-fighters/<path:filename>')
 def persisted_fighter_image(filename):
@@ -734,209 +1139,341 @@ def persisted_fighter_image(filename):
     return send_from_directory(fighters_dir, filename)
 
 
-@app.route('/')
-def home():
-    logger.info("--> Home page accessed")
-    fights = fetch_fights()
-    logger.info(f"  Rendering {len(fights)} fights")
-    
-    # Separate by sport and filter out prelims
-    ufc_fights = [f for f in fights if f.get('sport') == 'UFC' and f.get('card_type') != 'Prelims']
-    # Boxing: Only show main events (first fight per date/venue)
-    boxing_fights = [f for f in fights if f.get('sport') == 'Boxing' and f.get('is_main_event') == True]
+# ============================================================================
+# SLUG REGISTRY
+# ============================================================================
+# One SlugRegistry per snapshot resolves /event/<slug> and
+# /boxing-event/<slug> (and their legacy variants) with dict lookups.
 
-    # FEATURED FIGHTS - score-based, filtered to this week (next 7 days)
-    from datetime import date as date_cls, timedelta
-    today_date = date_cls.today()
-    week_cutoff = (today_date + timedelta(days=7)).isoformat()
-    today_iso = today_date.isoformat()
+_slug_registry_lock = threading.Lock()
+_slug_registry_cache = {'key': None, 'registry': None}
 
-    # Candidates: all main events / non-prelim fights within the next 7 days
-    # Exclude fights with TBA fighters or TBA times from featured section
-    featured_candidates = [
-        f for f in fights
-        if f.get('date', '') >= today_iso
-        and f.get('date', '') <= week_cutoff
-        and (f.get('is_main_event') or f.get('card_type') in ('Main Card', 'Title', None))
-        and f.get('card_type') != 'Prelims'
-        and f.get('fighter1', 'TBA') != 'TBA'
-        and f.get('fighter2', 'TBA') != 'TBA'
-        and f.get('time') and f.get('time') != 'TBA'
-    ]
 
-    # Score and sort: highest score first, then soonest date as tiebreaker
-    featured_candidates.sort(
-        key=lambda f: (-score_fight_for_featuring(f, today_date), f.get('date', ''))
+def get_slug_registry(snapshot=None):
+    """Slug registry for the current snapshot, built once per snapshot"""
+    snapshot = snapshot or current_snapshot()
+    cached = _slug_registry_cache
+    if cached['key'] == snapshot.signature:
+        return cached['registry']
+
+    with _slug_registry_lock:
+        if _slug_registry_cache['key'] != snapshot.signature:
+            registry = SlugRegistry(snapshot.copy_fights())
+            logger.info(f"Slug registry built: {len(registry.ufc_events)} UFC events, {len(registry.boxing_events)} boxing events")
+            _slug_registry_cache['registry'] = registry
+            _slug_registry_cache['key'] = snapshot.signature
+        return _slug_registry_cache['registry']
+
+
+# ============================================================================
+# HOME PAGE VIEW MODEL
+# ============================================================================
+# The home page sections only depend on the snapshot, today's date and the
+# fighter image index, so they are built once and reused by every request
+# until one of those changes.
+
+_home_view_lock = threading.Lock()
+_home_view_cache = {'key': None, 'view': None}
+
+
+def _is_featurable(fight, today_iso):
+    """Main-card fight with both fighters and a start time known"""
+    return (
+        fight.get('date', '') >= today_iso
+        and (fight.get('is_main_event') or fight.get('card_type') in ('Main Card', 'Title', None))
+        and fight.get('card_type') != 'Prelims'
+        and fight.get('fighter1', 'TBA') != 'TBA'
+        and fight.get('fighter2', 'TBA') != 'TBA'
+        and fight.get('time') and fight.get('time') != 'TBA'
     )
 
-    # Deduplicate by event: keep only the top-scored fight per event/date combo
+
+def _pick_featured(candidates, today_date, limit):
+    """Top-scored fight per event, highest score first then soonest date"""
+    big_names = BigNameFighter.matcher().classify(candidates)
+    scored = [
+        (score_fight_for_featuring(f, today_date, big_name=big), f)
+        for f, big in zip(candidates, big_names)
+    ]
+    scored.sort(key=lambda sf: (-sf[0], sf[1].get('date', '')))
+
     seen_events = set()
-    featured_fights = []
-    for fight in featured_candidates:
+    picked = []
+    for score, fight in scored:
         event_key = fight.get('event_name') or f"{fight['fighter1']} vs {fight['fighter2']}"
         dedup_key = f"{event_key}|{fight['date']}"
         if dedup_key not in seen_events:
             seen_events.add(dedup_key)
-            featured_fights.append(fight)
-        if len(featured_fights) >= 6:
+            picked.append((score, fight))
+        if len(picked) >= limit:
             break
+    return picked
+
+
+def build_home_view(fights, today_date, registry):
+    """
+    Build every home page section from a list of (already copied) fights.
+
+    Returns:
+        dict: Template context for index.html
+    """
+    today_iso = today_date.isoformat()
+    week_cutoff = (today_date + timedelta(days=7)).isoformat()
+
+    # Separate by sport and filter out prelims
+    ufc_fights = [f for f in fights if f.get('sport') == 'UFC' and f.get('card_type') != 'Prelims']
+    # Boxing: Only show main events (first fight per date/venue)
+    boxing_fights = [f for f in fights if f.get('sport') == 'Boxing' and f.get('is_main_event') == True]
+
+    # FEATURED FIGHTS - score-based, filtered to this week (next 7 days)
+    featured_candidates = [
+        f for f in fights
+        if _is_featurable(f, today_iso) and f.get('date', '') <= week_cutoff
+    ]
+    featured = _pick_featured(featured_candidates, today_date, limit=6)
 
     # Fallback: if no fights this week, show the next 2 best upcoming fights
     featured_section_title = 'Featured This Week'
-    if not featured_fights:
+    if not featured:
         featured_section_title = 'Coming Up Next'
-        fallback_candidates = [
-            f for f in fights
-            if f.get('date', '') >= today_iso
-            and (f.get('is_main_event') or f.get('card_type') in ('Main Card', 'Title', None))
-            and f.get('card_type') != 'Prelims'
-            and f.get('fighter1', 'TBA') != 'TBA'
-            and f.get('fighter2', 'TBA') != 'TBA'
-            and f.get('time') and f.get('time') != 'TBA'
-        ]
-        fallback_candidates.sort(
-            key=lambda f: (-score_fight_for_featuring(f, today_date), f.get('date', ''))
-        )
-        seen_events = set()
-        for fight in fallback_candidates:
-            event_key = fight.get('event_name') or f"{fight['fighter1']} vs {fight['fighter2']}"
-            dedup_key = f"{event_key}|{fight['date']}"
-            if dedup_key not in seen_events:
-                seen_events.add(dedup_key)
-                featured_fights.append(fight)
-            if len(featured_fights) >= 2:
-                break
-
-    for fight in featured_fights:
-        logger.info(f"  Featured: {fight['fighter1']} vs {fight['fighter2']} ({fight['date']}, score={score_fight_for_featuring(fight, today_date)})")
-    
+        fallback_candidates = [f for f in fights if _is_featurable(f, today_iso)]
+        featured = _pick_featured(fallback_candidates, today_date, limit=2)
+
+    for score, fight in featured:
+        logger.info(f"  Featured: {fight['fighter1']} vs {fight['fighter2']} ({fight['date']}, score={score})")
+    featured_fights = [fight for _, fight in featured]
+
     # Remove featured from main lists
     featured_ids = {id(f) for f in featured_fights}
     ufc_fights = [f for f in ufc_fights if id(f) not in featured_ids]
     boxing_fights = [f for f in boxing_fights if id(f) not in featured_ids]
-    
+
     # Limit horizontal scroll sections (show more fights)
     ufc_scroll = ufc_fights[:12]
     boxing_scroll = boxing_fights[:12]
-    
+
     # Coming up soon: Everything else
     coming_soon = ufc_fights[12:] + boxing_fights[12:]
     coming_soon = sorted(coming_soon, key=lambda x: x['date'])[:20]  # Show 20 max
-    
+
     logger.info(f"  Sections: Featured={len(featured_fights)}, UFC={len(ufc_scroll)}, Boxing={len(boxing_scroll)}, Coming Soon={len(coming_soon)}")
-    
-    # Dynamically load fighter images (always fresh from JSON)
-    all_fights_to_display = featured_fights + ufc_scroll + boxing_scroll + coming_soon
-    for fight in all_fights_to_display:
-        if not fight.get('fighter1_image'):
-            img = get_fighter_image(fight['fighter1'])
-            if img:
-                fight['fighter1_image'] = img
-        if not fight.get('fighter2_image'):
-            img = get_fighter_image(fight['fighter2'])
-            if img:
-                fight['fighter2_image'] = img
-        
-        # Generate slugs for URLs
-        if fight.get('sport') == 'Boxing':
-            fight['slug'] = f"{_to_slug(fight['fighter1'])}-vs-{_to_slug(fight['fighter2'])}-{fight['date']}"
-    
-    return render_template('index.html',
-                         featured_fights=featured_fights,
-                         featured_section_title=featured_section_title,
-                         ufc_fights=ufc_scroll,
-                         boxing_fights=boxing_scroll,
-                         coming_soon=coming_soon)
+
+    # Fill in fighter images and canonical event URLs once per build
+    for fight in featured_fights + ufc_scroll + boxing_scroll + coming_soon:
+        fighter_image_index.fill(fight)
+        fight['url'] = registry.url_for(fight)
+        # Merge bookkeeping would otherwise be serialized into the page
+        for field in PROVENANCE_FIELDS:
+            fight.pop(field, None)
+
+    return {
+        'featured_fights': featured_fights,
+        'featured_section_title': featured_section_title,
+        'ufc_fights': ufc_scroll,
+        'boxing_fights': boxing_scroll,
+        'coming_soon': coming_soon,
+    }
+
+
+def get_home_view():
+    """Home page view model, rebuilt only on snapshot/date/image changes"""
+    from datetime import date as date_cls
+    snapshot = current_snapshot()
+    today_date = date_cls.today()
+    key = (
+        snapshot.signature,
+        today_date,
+        fighter_image_index.version,
+        BigNameFighter.matcher().signature,
+    )
+
+    cached = _home_view_cache
+    if cached['key'] == key:
+        return cached['view']
+
+    with _home_view_lock:
+        if _home_view_cache['key'] != key:
+            logger.info(f"Building home view for {today_date.isoformat()} ({len(snapshot.fights)} fights)")
+            view = build_home_view(snapshot.copy_fights(), today_date, get_slug_registry(snapshot))
+            _home_view_cache['view'] = view
+            _home_view_cache['key'] = key
+        return _home_view_cache['view']
+
+
+# ============================================================================
+# RENDERED PAGE CACHE
+# ============================================================================
+# Public pages are identical for every visitor (times are converted to local
+# time client-side), so each route's HTML is rendered once per content version
+# and served with a strong ETag / Last-Modified for 304 revalidation.
+# Compressed variants are built once per page at maximum levels and served
+# directly, so flask_compress never re-gzips a cached page.
+PAGE_CACHE_MAX_ENTRIES = 512
+PAGE_GZIP_LEVEL = 9
+PAGE_BROTLI_QUALITY = 11
+PAGE_ENCODINGS = ['br', 'gzip'] if brotli else ['gzip']
+
+_page_cache_lock = threading.Lock()
+_page_cache = OrderedDict()  # (path, version) -> CachedPage
+
+
+class CachedPage:
+    """One rendered page plus its validators and compressed variants"""
+
+    __slots__ = ('body', 'etag', 'last_modified', '_variants', '_lock')
+
+    def __init__(self, body):
+        self.body = body.encode('utf-8') if isinstance(body, str) else body
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+        self._variants = {}
+        self._lock = threading.Lock()
+
+    def variant(self, encoding):
+        """Body compressed with `encoding` ('br' or 'gzip'), built on first use"""
+        data = self._variants.get(encoding)
+        if data is not None:
+            return data
+        with self._lock:
+            if encoding not in self._variants:
+                if encoding == 'br':
+                    self._variants[encoding] = brotli.compress(self.body, quality=PAGE_BROTLI_QUALITY)
+                else:
+                    self._variants[encoding] = gzip.compress(self.body, compresslevel=PAGE_GZIP_LEVEL, mtime=0)
+            return self._variants[encoding]
+
+
+def page_content_version():
+    """Everything a public page's HTML depends on besides the URL"""
+    from datetime import date as date_cls
+    return (
+        current_snapshot().signature,
+        date_cls.today(),
+        fighter_image_index.version,
+        BigNameFighter.matcher().signature,
+    )
+
+
+def _preview_revision(fight):
+    """When the headline's stored preview last changed (None if there is none yet)"""
+    if fight is None:
+        return None
+    try:
+        return preview_store.updated_at(fight_id(fight))
+    except Exception as e:
+        logger.warning(f"Could not read preview revision: {e}")
+        return None
+
+
+def _is_not_modified(page, etag):
+    """
+    True if the request's validators still match the cached page.
+
+    etag is the tag of the representation this request negotiated - each
+    compressed variant has its own, so a client holding the gzip ETag that
+    now asks for br (or identity) gets the full body, not a 304.
+    """
+    if request.if_none_match:
+        return request.if_none_match.star_tag or etag in request.if_none_match.as_set()
+    if request.if_modified_since:
+        return request.if_modified_since >= page.last_modified
+    return False
+
+
+def cached_page(view=None, *, headline=None):
+    """
+    Cache a public route's rendered HTML per path and content version.
+
+    headline: callable(**view kwargs) -> the fight whose AI preview the page
+    shows (or None). Only pages that show a preview pass it, so a preview
+    write re-renders that event's page and nothing else.
+    """
+    if view is None:
+        return lambda view: cached_page(view, headline=headline)
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.path, page_content_version())
+        if headline is not None:
+            key += (_preview_revision(headline(**kwargs)),)
+        with _page_cache_lock:
+            page = _page_cache.get(key)
+            if page is not None:
+                _page_cache.move_to_end(key)
+
+        if page is None:
+            rv = view(*args, **kwargs)
+            if not isinstance(rv, str):
+                return rv  # Errors, redirects and tuples are never cached
+            page = CachedPage(rv)
+            with _page_cache_lock:
+                _page_cache[key] = page
+                while len(_page_cache) > PAGE_CACHE_MAX_ENTRIES:
+                    _page_cache.popitem(last=False)
+        else:
+            logger.debug(f"Page cache hit: {request.path}")
+
+        encoding = request.accept_encodings.best_match(PAGE_ENCODINGS)
+        # Same ":<encoding>" suffix convention as flask_compress
+        etag = f"{page.etag}:{encoding}" if encoding else page.etag
+        if _is_not_modified(page, etag):
+            response = make_response('', 304)
+        elif encoding:
+            response = make_response(page.variant(encoding))
+            response.headers['Content-Encoding'] = encoding
+        else:
+            response = make_response(page.body)
+        response.headers['Content-Type'] = 'text/html; charset=utf-8'
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.set_etag(etag)
+        response.last_modified = page.last_modified
+        response.headers['Cache-Control'] = 'public, max-age=0, must-revalidate'
+        return response
+
+    return wrapper
+
+
+@app.route('/')
+@cached_page
+def home():
+    logger.info("--> Home page accessed")
+    return render_template('index.html', **get_home_view())
+
+def ufc_headline(event):
+    """Main event of a UFC card: first main card fight, else the first fight"""
+    main_card = [f for f in event['fights'] if f.get('card_type') == 'Main Card']
+    return main_card[0] if main_card else event['fights'][0]
+
+
+def _ufc_page_headline(event_slug):
+    event = get_slug_registry().ufc_event(event_slug)
+    return ufc_headline(event) if event else None
+
+
+def _boxing_page_headline(event_slug):
+    event = get_slug_registry().boxing_event(event_slug)
+    return event['main_event'] if event else None
+
 
 @app.route('/event/<event_slug>')
+@cached_page(headline=_ufc_page_headline)
 def event_detail(event_slug):
     """Show detailed page for a specific event with full card"""
     logger.info(f"--> Event detail accessed: {event_slug}")
-    fights = fetch_fights()
-    
-    # Extract date from slug (last 10 chars: YYYY-MM-DD)
-    # Slug format: "ufc-323-dvalishvili-vs-yan-2-2025-01-25"
-    try:
-        event_date = event_slug[-10:]  # Get last 10 characters (date)
-        event_name_slug = event_slug[:-11]  # Everything except date and last hyphen
-        logger.debug(f"  Parsed slug - date: {event_date}, name: {event_name_slug}")
-    except:
-        event_date = None
-        event_name_slug = event_slug
-        logger.debug(f"  Could not parse slug, using full: {event_slug}")
-    
-    # Group fights by event
-    ufc_events = {}
-    for fight in fights:
-        if fight['sport'] == 'UFC':
-            event_name = fight.get('event_name', '')
-            if event_name not in ufc_events:
-                ufc_events[event_name] = []
-            ufc_events[event_name].append(fight)
-    
-    logger.debug(f"  Found {len(ufc_events)} UFC events")
-    for name, fights_list in ufc_events.items():
-        first_fight = fights_list[0] if fights_list else None
-        if first_fight:
-            logger.debug(f"    - {name}: DATE={first_fight['date']} ({len(fights_list)} fights)")
-    
-    # Find matching event by slug and date
-    event_fights_list = None
-    matched_event_name = None
-    
-    logger.debug(f"  Searching through {len(ufc_events)} events")
-    
-    # PRIORITY 1: Match by date (most reliable)
-    if event_date:
-        for event_name, fights_list in ufc_events.items():
-            # Check if any fight in this event has matching date
-            for fight in fights_list:
-                if fight.get('date') == event_date:
-                    event_fights_list = fights_list
-                    matched_event_name = event_name
-                    logger.info(f"  [OK] Matched by DATE: {matched_event_name} ({len(fights_list)} fights)")
-                    break
-            if event_fights_list:
-                break
-    
-    # PRIORITY 2: Match by event name slug (fallback)
-    if not event_fights_list:
-        for event_name, fights_list in ufc_events.items():
-            # Create slug from this event name
-            test_slug = event_name.lower().replace(' ', '-').replace(':', '').replace(',', '')
-            test_slug = re.sub(r'[^a-z0-9-]', '', test_slug)
-            
-            # Check if slug matches
-            if test_slug in event_name_slug or event_name_slug in test_slug:
-                event_fights_list = fights_list
-                matched_event_name = event_name
-                logger.info(f"  [OK] Matched by NAME: {matched_event_name}")
-                break
-    
-    # PRIORITY 3: Fallback to first event (last resort)
-    if not event_fights_list and ufc_events:
-        matched_event_name = list(ufc_events.keys())[0]
-        event_fights_list = ufc_events[matched_event_name]
-        logger.warning(f"  [!] No match found, using first event: {matched_event_name}")
-    
-    if not ufc_events:
-        # Fallback to dummy data if no UFC events
-        event_fights = {
-            'event_name': 'No UFC Events Found',
-            'date': '2025-01-01',
-            'venue': 'TBA',
-            'main_event': {
-                'fighter1': 'TBA',
-                'fighter2': 'TBA',
-                'fighter1_image': '/static/placeholder-fighter-mma.png',
-                'fighter2_image': '/static/placeholder-fighter-mma.png',
-                'weight_class': 'TBA',
-                'time': '00:00'
-            },
-            'main_card': [],
-            'prelims': []
-        }
-        return render_template('event_detail.html', event=event_fights)
+    registry = get_slug_registry()
+    event = registry.ufc_event(event_slug)
+
+    if event is None:
+        target = registry.redirect_for(f"/event/{event_slug}")
+        if target:
+            logger.info(f"  Redirecting {event_slug} -> {target}")
+            return redirect(target, code=301)
+        logger.warning(f"No UFC event found for {event_slug}")
+        return "Event not found", 404
+
+    matched_event_name = event['event_name']
+    event_fights_list = event['fights']
+    logger.info(f"  [OK] Matched: {matched_event_name} ({len(event_fights_list)} fights)")
     
     # Separate main card and prelims
     main_card_fights = [f for f in event_fights_list if f.get('card_type') == 'Main Card']
@@ -945,7 +1482,7 @@ def event_detail(event_slug):
     logger.debug(f"  Main card fights: {len(main_card_fights)}, Prelims: {len(prelim_fights)}")
     
     # Get main event (first fight in main card)
-    main_event_fight = main_card_fights[0] if main_card_fights else event_fights_list[0]
+    main_event_fight = fighter_image_index.fill(dict(ufc_headline(event)))
     
     logger.info(f"  Main event: {main_event_fight['fighter1']} vs {main_event_fight['fighter2']}")
     logger.info(f"  Event date: {main_event_fight['date']}, Time: {main_event_fight.get('time', 'TBA')}")
@@ -990,17 +1527,9 @@ def event_detail(event_slug):
         'prelim_time': prelim_fights[0].get('time', 'TBA') if prelim_fights else 'TBA'
     }
     
-    # Load AI preview for main event
-    preview = get_or_generate_preview(
-        preview_id=event_slug,
-        fighter1=main_event_fight['fighter1'],
-        fighter2=main_event_fight['fighter2'],
-        sport='UFC',
-        is_title=(main_event_fight.get('weight_class') == 'Title'),
-        weight_class=None  # UFC doesn't extract weight classes
-    )
-    
-    event_data['preview'] = preview
+    # AI preview for main event (queued in the background on a cache miss)
+    event_data['preview'] = request_preview(main_event_fight, legacy_preview_ids(main_event_fight, event_slug))
+    event_data['preview_id'] = fight_id(main_event_fight)
     
     # SEO metadata
     event_data['meta_description'] = f"{matched_event_name} on {main_event_fight['date']} at {main_event_fight['venue']}. Full fight card, main card and prelims."
@@ -1010,57 +1539,33 @@ def event_detail(event_slug):
     return render_template('event_detail.html', event=event_data)
 
 @app.route('/boxing-event/<event_slug>')
+@cached_page(headline=_boxing_page_headline)
 def boxing_event_detail(event_slug):
     """Show boxing event details using fighter names in URL"""
     logger.info(f"Boxing event accessed: {event_slug}")
-    
-    all_fights = fetch_fights()
-    boxing_fights = [f for f in all_fights if f.get('sport') == 'Boxing']
-    
-    # Parse slug: fighter1-vs-fighter2-YYYY-MM-DD
-    parts = event_slug.rsplit('-', 3)
-    if len(parts) >= 3:
-        date_str = f"{parts[-3]}-{parts[-2]}-{parts[-1]}"
-        fighter_slug = '-'.join(parts[:-3])
-    else:
-        return "Invalid event URL", 404
-    
-    # Find any fight matching this slug (not restricted to main event)
-    target_fight = None
-    for fight in boxing_fights:
-        if fight['date'] == date_str:
-            f1 = _to_slug(fight['fighter1'])
-            f2 = _to_slug(fight['fighter2'])
-            fight_slug = f"{f1}-vs-{f2}"
-            if fight_slug == fighter_slug:
-                target_fight = fight
-                break
-
-    if not target_fight:
+    registry = get_slug_registry()
+    event = registry.boxing_event(event_slug)
+
+    if event is None:
+        target = registry.redirect_for(f"/boxing-event/{event_slug}")
+        if target:
+            logger.info(f"Redirecting {event_slug} -> {target}")
+            return redirect(target, code=301)
         logger.warning(f"No boxing fight found for {event_slug}")
         return "Event not found", 404
 
-    # Get all fights from same venue/date
-    event_fights = [f for f in boxing_fights
-                    if f['date'] == date_str and f['venue'] == target_fight['venue']]
+    # Copy so per-request image fills never touch the shared registry
+    main_event_fight = dict(event['main_event'])
+    event_fights = [main_event_fight] + [dict(f) for f in event['fights'] if f is not event['main_event']]
 
-    # Use the actual main event if available, otherwise fall back to the matched fight
-    main_event_fight = next((f for f in event_fights if f.get('is_main_event')), target_fight)
-
-    # Re-fetch images live from fighters.json so newly added images are always visible
+    # Apply the live image index so newly added images and overrides are visible
     # (the cache may predate the image being added)
     for fight in event_fights:
-        for key in ('fighter1', 'fighter2'):
-            img_key = f'{key}_image'
-            if not fight.get(img_key):
-                img = get_fighter_image(fight[key])
-                if img:
-                    fight[img_key] = img
+        fighter_image_index.fill(fight)
 
     logger.info(f"Found {len(event_fights)} fights for this event")
     
-    event_fights_sorted = sorted(event_fights, key=lambda x: not x.get('is_main_event', False))
-    undercard = event_fights_sorted[1:]
+    undercard = sorted(event_fights[1:], key=lambda x: not x.get('is_main_event', False))
     
     logger.info(f"Main event: {main_event_fight['fighter1']} vs {main_event_fight['fighter2']}")
     
@@ -1082,23 +1587,9 @@ def boxing_event_detail(event_slug):
         'fights': [main_event_fight] + undercard
     }
     
-    # Generate AI preview for main event
-    # Create preview ID from sorted fighter names + date for consistency
-    fighters_sorted = sorted([main_event_fight['fighter1'], main_event_fight['fighter2']])
-    fighter1_slug = fighters_sorted[0].lower().replace(' ', '-').replace("'", '')
-    fighter2_slug = fighters_sorted[1].lower().replace(' ', '-').replace("'", '')
-    preview_id = f"boxing_{fighter1_slug}_{fighter2_slug}_{main_event_fight['date']}"
-    
-    preview = get_or_generate_preview(
-        preview_id=preview_id,
-        fighter1=main_event_fight['fighter1'],
-        fighter2=main_event_fight['fighter2'],
-        sport='Boxing',
-        is_title=('Title' in main_event_fight.get('weight_class', '')),
-        weight_class=main_event_fight.get('weight_class')
-    )
-    
-    event_data['preview'] = preview
+    # AI preview for main event (queued in the background on a cache miss)
+    event_data['preview'] = request_preview(main_event_fight, legacy_preview_ids(main_event_fight))
+    event_data['preview_id'] = fight_id(main_event_fight)
     
     # SEO metadata
     event_data['meta_description'] = f"{main_event_fight['fighter1']} vs {main_event_fight['fighter2']} - {main_event_fight.get('weight_class', 'Boxing match')} on {main_event_fight['date']} at {main_event_fight['venue']}, {main_event_fight['location']}. Full fight card and AI-powered preview."
@@ -1134,32 +1625,20 @@ def espn_data():
 def sitemap():
     """Generate dynamic sitemap"""
     from xml.sax.saxutils import escape as xml_escape
-    fights = fetch_fights()
+    registry = get_slug_registry()
     today = datetime.now().strftime('%Y-%m-%d')
 
     pages = []
     pages.append({'loc': 'https://fightschedule.live/', 'lastmod': today, 'changefreq': 'daily', 'priority': '1.0'})
     pages.append({'loc': 'https://fightschedule.live/privacy', 'lastmod': today, 'changefreq': 'yearly', 'priority': '0.3'})
 
-    # UFC events
-    ufc_fights = [f for f in fights if f.get('sport') == 'UFC' and f.get('card_type') != 'Prelims']
-    seen = set()
-    for fight in ufc_fights:
-        slug = f"{fight['event_name'].lower().replace(' ', '-').replace(':', '').replace(',', '')}-{fight['date']}"
-        if slug not in seen:
-            pages.append({'loc': f"https://fightschedule.live/event/{slug}", 'lastmod': fight['date'], 'changefreq': 'weekly', 'priority': '0.8'})
-            seen.add(slug)
-
-    # Boxing events - all main events
-    boxing_fights = [f for f in fights if f.get('sport') == 'Boxing' and f.get('is_main_event')]
-    seen = set()
-    for fight in boxing_fights:
-        f1 = fight['fighter1'].lower().replace(' ', '-').replace("'", '')
-        f2 = fight['fighter2'].lower().replace(' ', '-').replace("'", '')
-        slug = f"{f1}-vs-{f2}-{fight['date']}"
-        if slug not in seen:
-            pages.append({'loc': f"https://fightschedule.live/boxing-event/{slug}", 'lastmod': fight['date'], 'changefreq': 'weekly', 'priority': '0.7'})
-            seen.add(slug)
+    # UFC events with a main card, then all boxing events, by canonical slug
+    for slug, event in registry.ufc_events.items():
+        if event['has_main_card']:
+            pages.append({'loc': f"https://fightschedule.live/event/{slug}", 'lastmod': event['date'], 'changefreq': 'weekly', 'priority': '0.8'})
+
+    for slug, event in registry.boxing_events.items():
+        pages.append({'loc': f"https://fightschedule.live/boxing-event/{slug}", 'lastmod': event['date'], 'changefreq': 'weekly', 'priority': '0.7'})
 
     xml = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
     for p in pages:
@@ -1294,16 +1773,78 @@ A: Yes, completely free with no account required.
     response.headers['Cache-Control'] = 'public, max-age=86400'
     return response
 
+@app.route('/api/preview/<preview_id>')
+def preview_status(preview_id):
+    """
+    Preview hydration for event pages rendered with a placeholder.
+    status: ready | pending | failed (stop polling) | unknown (not an event headline)
+    """
+    headers = {'Cache-Control': 'no-store'}
+    preview = get_cached_preview(preview_id)
+    if preview:
+        return {'status': 'ready', 'parsed': preview.get('parsed')}, 200, headers
+
+    registry = get_slug_registry()
+    fight = registry.fight(preview_id)
+    if fight is None or registry.headline_for(fight) is not fight:
+        return {'status': 'unknown'}, 404, headers
+
+    # The page may have been rendered (and queued) by another worker
+    status = preview_queue.status(preview_id) or preview_queue.submit(preview_id, **preview_job(fight))
+    return {'status': status}, 200, headers
+
+@app.route('/admin/refresh-status')
+def refresh_status():
+    """JSON view of snapshot age and background refresh state"""
+    return get_refresh_status()
+
+@app.route('/admin/preview-status')
+def preview_status_admin():
+    """JSON view of the preview API client and background queue"""
+    return {
+        'api_key_set': bool(ANTHROPIC_API_KEY),
+        'client': preview_client.describe(),
+        'queue': preview_queue.describe(),
+        'stored_previews_revision': preview_store.version,
+    }
+
+@app.route('/admin/http-stats')
+def http_stats():
+    """
+    JSON outbound HTTP stats: per-host requests, statuses and latency/size
+    histograms, plus how scraped pages were served (304 / unchanged region /
+    parsed) by the page cache.
+    """
+    return {
+        'hosts': http.stats(),
+        'page_cache': page_cache.stats(),
+    }
+
 @app.route('/admin/clear-cache')
 def clear_cache():
-    """Clear the fights cache file"""
-    cache_file = CACHE_FILE
-    if os.path.exists(cache_file):
-        os.remove(cache_file)
+    """Unpublish the current snapshot so the next page load scrapes fresh data"""
+    if snapshot_store.clear():
+        invalidate_snapshot()
         logger.info("Cache cleared manually via admin route")
         return "✓ Cache cleared successfully. Next page load will fetch fresh data."
     return "No cache file found."
 
+@app.route('/admin/snapshots')
+def list_snapshots():
+    """JSON list of stored snapshot generations"""
+    return {'snapshots': snapshot_store.describe()}
+
+@app.route('/admin/snapshots/rollback/<int:generation>')
+def rollback_snapshot(generation):
+    """Re-publish an older snapshot generation"""
+    try:
+        snapshot_store.rollback(generation)
+    except Exception as e:
+        logger.error(f"Snapshot rollback to {generation} failed: {e}")
+        return f"Could not roll back to generation {generation}.", 404
+    invalidate_snapshot()
+    return f"✓ Rolled back to snapshot generation {generation}."
+
 ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
 
 @app.route('/admin/upload-images', methods=['GET', 'POST'])
@@ -1366,10 +1907,8 @@ def upload_fighter_images():
     search_name = request.args.get('search', '').strip()
     show_all = request.args.get('show_all') == 'true'
     
-    try:
-        with open(CACHE_FILE, 'r') as f:
-            cache = json.load(f)
-    except:
+    cache = snapshot_store.load_current()
+    if cache is None:
         return "No cache found. Visit homepage first to generate cache.", 404
 
     # Load databases from persistent data directory
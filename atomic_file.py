@@ -0,0 +1,28 @@
+"""
+Atomic File Writes
+Files that other workers read while they are being refreshed (snapshot
+generations, the CURRENT pointer, scraper page caches) are written to a
+temp file in the same directory and renamed into place, so a reader sees
+either the old contents or the new ones - never a partial file.
+"""
+
+import os
+import tempfile
+
+
+def atomic_write(path, text):
+    """Write text to path via a temp file + fsync + rename"""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,99 @@
+"""
+Stable Fight / Event Identity
+Content-hashed IDs assigned when fights are ingested and stored on every
+record, so time overrides, AI previews, image lookups and the slug registry
+all join on the same key instead of each building its own string.
+
+    fight_id   f-<12 hex>   normalized fighter names (order-insensitive) + date
+    event_id   e-<12 hex>   UFC: normalized event name
+                            Boxing: the fight_id of the card's headline
+"""
+
+import hashlib
+import re
+import unicodedata
+from functools import lru_cache
+
+_VS_RE = re.compile(r'\s+vs\.?\s+', re.IGNORECASE)
+_PUNCTUATION_RE = re.compile(r"[.'`]")
+
+
+@lru_cache(maxsize=8192)
+def normalize_name(name):
+    """Lowercase, strip diacritics/punctuation and collapse whitespace"""
+    decomposed = unicodedata.normalize('NFD', name or '')
+    ascii_name = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')
+    ascii_name = _PUNCTUATION_RE.sub('', ascii_name.lower()).replace('-', ' ')
+    return ' '.join(ascii_name.split())
+
+
+def _digest(prefix, text):
+    return f"{prefix}-{hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]}"
+
+
+def fight_id_for(fighter1, fighter2, date):
+    """ID for a matchup on a date; fighter order, case and accents don't matter"""
+    names = sorted((normalize_name(fighter1), normalize_name(fighter2)))
+    return _digest('f', f"{names[0]}|{names[1]}|{(date or '').strip()}")
+
+
+def fight_id(fight):
+    """Stored fight_id, or the computed one for records that predate IDs"""
+    return fight.get('fight_id') or fight_id_for(fight.get('fighter1'), fight.get('fighter2'), fight.get('date'))
+
+
+def override_fight_id(fight_key):
+    """fight_id for a time_overrides.json key ("F1 vs F2|YYYY-MM-DD"), or None if malformed"""
+    matchup, sep, date = fight_key.rpartition('|')
+    names = _VS_RE.split(matchup.strip(), maxsplit=1)
+    if not sep or len(names) != 2:
+        return None
+    return fight_id_for(names[0], names[1], date)
+
+
+def assign_ids(fights):
+    """
+    Set fight_id and event_id on every fight in place.
+
+    Boxing cards follow the scraped order: a headline (is_main_event not False)
+    opens a card and the following undercard fights at the same date/venue
+    belong to it.
+    """
+    latest_card = {}
+    for fight in fights:
+        fight['fight_id'] = fight_id_for(fight.get('fighter1'), fight.get('fighter2'), fight.get('date'))
+        if fight.get('sport') == 'UFC':
+            fight['event_id'] = _digest('e', f"ufc|{normalize_name(fight.get('event_name'))}")
+            continue
+
+        venue_key = (fight.get('date'), fight.get('venue'))
+        if fight.get('is_main_event') is False and venue_key in latest_card:
+            fight['event_id'] = latest_card[venue_key]
+        else:
+            fight['event_id'] = _digest('e', f"boxing|{fight['fight_id']}")
+            latest_card[venue_key] = fight['event_id']
+    return fights
+
+
+def ensure_ids(fights):
+    """assign_ids() for snapshots written before IDs existed (no-op otherwise)"""
+    if all(f.get('fight_id') and f.get('event_id') for f in fights):
+        return fights
+    return assign_ids(fights)
+
+
+def legacy_preview_ids(fight, event_slug=None):
+    """Keys older code stored this fight's AI preview under, for migration"""
+    if fight.get('sport') == 'UFC':
+        return [event_slug] if event_slug else []
+    date = fight.get('date')
+    # boxing_event_detail: sorted names, apostrophes stripped
+    ordered = sorted([fight['fighter1'], fight['fighter2']])
+    sorted_slugs = [n.lower().replace(' ', '-').replace("'", '') for n in ordered]
+    # generate_previews.py: scraped order, apostrophes kept
+    raw_slugs = [fight[k].lower().replace(' ', '-') for k in ('fighter1', 'fighter2')]
+    ids = [f"boxing_{sorted_slugs[0]}_{sorted_slugs[1]}_{date}"]
+    raw_id = f"boxing_{raw_slugs[0]}_{raw_slugs[1]}_{date}"
+    if raw_id not in ids:
+        ids.append(raw_id)
+    return ids
@@ -0,0 +1,126 @@
+"""
+Fighter Image Index
+A single in-memory name -> image URL index built from the fighter databases
+and the admin's image overrides, rebuilt only when one of the files changes.
+
+Lookup precedence (first hit wins):
+    1. fighter_image_overrides.json (admin panel, normalized name)
+    2. Image already on the scraped fight record
+    3. fighters_ufc.json
+    4. fighters.json
+
+Overrides are applied when pages are rendered, never written into the
+snapshot (fill(..., overrides=False) at scrape time), so removing one
+restores the database image on the next request.
+
+Database names are tried exactly first, then by normalized name (the same
+normalize_name fight_ids.py builds fight_id from), so accent/case/punctuation
+variants between scrapers still join.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from fight_ids import normalize_name
+
+logger = logging.getLogger('fight_schedule')
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _load_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        logger.warning(f"Could not load {path}: {e}")
+        return default
+
+
+class FighterImageIndex:
+    """mtime-invalidated image lookups; files are stat()ed at most once per `check_interval`"""
+
+    def __init__(self, general_path, ufc_path, overrides_path, check_interval=1.0):
+        self.paths = (general_path, ufc_path, overrides_path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = 0.0
+        self._images = {}
+        self._images_by_key = {}
+        self._overrides = {}
+
+    def _rebuild(self, version):
+        general_path, ufc_path, overrides_path = self.paths
+
+        images = {}
+        # UFC database takes priority for UFC fighters; entries without a URL
+        # must not shadow a real image for the same fighter
+        for path in (general_path, ufc_path):
+            images.update((name, url) for name, url in _load_json(path, {}).items() if url)
+
+        images_by_key = {}
+        for name, url in images.items():
+            images_by_key.setdefault(normalize_name(name), url)
+
+        overrides = {}
+        for item in _load_json(overrides_path, []):
+            name = normalize_name(item.get('fighter_name'))
+            if name and item.get('image_url'):
+                overrides[name] = item['image_url']
+
+        self._images = images
+        self._images_by_key = images_by_key
+        self._overrides = overrides
+        self._version = version
+        logger.info(f"Fighter image index built: {len(images)} fighters, {len(overrides)} overrides")
+
+    def _refresh(self):
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.check_interval:
+            return
+        version = tuple(_file_signature(p) for p in self.paths)
+        with self._lock:
+            self._checked_at = now
+            if version != self._version:
+                self._rebuild(version)
+
+    @property
+    def version(self):
+        """Changes whenever any of the source files changes"""
+        self._refresh()
+        return self._version
+
+    def lookup(self, fighter_name, scraped_url=None, overrides=True):
+        """Best image URL for a fighter, or None (overrides=False skips the admin overrides)"""
+        if not fighter_name or fighter_name == 'TBA':
+            return scraped_url or None
+        self._refresh()
+        key = normalize_name(fighter_name)
+        return (
+            (overrides and self._overrides.get(key))
+            or scraped_url
+            or self._images.get(fighter_name)
+            or self._images_by_key.get(key)
+            or None
+        )
+
+    def fill(self, fight, overrides=True):
+        """Set fighter1_image / fighter2_image on a fight dict in place"""
+        for key in ('fighter1', 'fighter2'):
+            img_key = f'{key}_image'
+            img = self.lookup(fight.get(key), fight.get(img_key), overrides=overrides)
+            if img:
+                fight[img_key] = img
+        return fight
@@ -1,103 +1,115 @@
 """
-Pre-generate AI previews on deployment to avoid slow page loads
+Pre-generate AI previews so event pages are cache hits.
+
+Runs in a background thread after every successful snapshot refresh (see
+run_preview_pregeneration in app.py) and can still be run by hand:
+
+    python generate_previews.py
+
+Every upcoming event headline is ranked by score_fight_for_featuring() and
+previews are generated best-first, a few at a time, until the run's token
+budget is spent. Headlines that already have a preview are skipped.
+
+This module takes its app dependencies as arguments so app.py can import it.
 """
-import sys
+import logging
 import os
-from app import fetch_fights, get_or_generate_preview, is_big_name_fight, logger
-
-def generate_all_previews():
-    """Generate previews for featured and main card fights"""
-    logger.info("=" * 60)
-    logger.info("PRE-GENERATING AI PREVIEWS")
-    logger.info("=" * 60)
-    
-    try:
-        fights = fetch_fights()
-        
-        # Separate by sport, filter out prelims
-        ufc_fights = [f for f in fights if f.get('sport') == 'UFC' and f.get('card_type') != 'Prelims']
-        boxing_fights = [f for f in fights if f.get('sport') == 'Boxing']
-        
-        # Get featured fights
-        featured = []
-        
-        # UFC Featured: Next title fight OR first UFC event
-        ufc_featured = None
-        for fight in ufc_fights:
-            if fight.get('weight_class') == 'Title':
-                ufc_featured = fight
-                break
-        if not ufc_featured and ufc_fights:
-            ufc_featured = ufc_fights[0]
-        if ufc_featured:
-            featured.append(ufc_featured)
-        
-        # Boxing Featured: Next big-name fight
-        for fight in boxing_fights:
-            if is_big_name_fight(fight):
-                featured.append(fight)
-                break
-        
-        # Generate previews for ONLY 2 featured fights (TESTING LIMIT)
-        to_generate = featured[:2]
-        
-        logger.info(f"Limiting preview generation to {len(to_generate)} fights for testing")
-        
-        generated = 0
-        skipped = 0
-        
-        for fight in to_generate:
-            try:
-                # Create preview ID
-                if fight.get('sport') == 'UFC':
-                    preview_id = f"{fight['event_name'].lower().replace(' ', '-').replace(':', '').replace(',', '')}-{fight['date']}"
-                else:
-                    fighter1_slug = fight['fighter1'].lower().replace(' ', '-')
-                    fighter2_slug = fight['fighter2'].lower().replace(' ', '-')
-                    preview_id = f"boxing_{fighter1_slug}_{fighter2_slug}_{fight['date']}"
-                
-                # Generate preview
-                is_title = fight.get('weight_class') == 'Title'
-                preview = get_or_generate_preview(
-                    preview_id=preview_id,
-                    fighter1=fight['fighter1'],
-                    fighter2=fight['fighter2'],
-                    sport=fight['sport'],
-                    is_title=is_title,
-                    weight_class=fight.get('weight_class')
-                )
-                
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from fight_ids import fight_id, legacy_preview_ids
+
+logger = logging.getLogger('fight_schedule')
+
+PREGEN_CONCURRENCY = int(os.environ.get('PREVIEW_PREGEN_CONCURRENCY', 3))
+PREGEN_TOKEN_BUDGET = int(os.environ.get('PREVIEW_PREGEN_TOKEN_BUDGET', 50000))
+
+
+def rank_headlines(fights, registry, score, today_date):
+    """Each event's headline fight once, highest featuring score first (then soonest)"""
+    seen = set()
+    headlines = []
+    for fight in fights:
+        headline = registry.headline_for(fight)
+        if headline is None or headline['fight_id'] in seen:
+            continue
+        seen.add(headline['fight_id'])
+        headlines.append(headline)
+
+    scored = [(score(f, today_date), f) for f in headlines]
+    scored.sort(key=lambda item: (-item[0], item[1].get('date') or '9999-12-31'))
+    return [f for _, f in scored]
+
+
+def pregenerate_previews(fights, registry, score, get_cached, generate, job_for,
+                         tokens_per_preview, token_budget=PREGEN_TOKEN_BUDGET,
+                         concurrency=PREGEN_CONCURRENCY):
+    """
+    Generate missing previews for upcoming headlines within a token budget.
+
+    Args:
+        fights: Snapshot fights (carrying fight_id / event_id)
+        registry: SlugRegistry built from the same snapshot
+        score: score_fight_for_featuring(fight, today_date)
+        get_cached: get_cached_preview(preview_id, legacy_ids) -> preview or None
+        generate: callable(preview_id, **job) that generates and saves a preview
+        job_for: callable(fight) -> keyword arguments for `generate`
+        tokens_per_preview: Worst-case tokens one API call can use
+        token_budget: Tokens this run may spend
+        concurrency: Parallel API calls
+
+    Returns:
+        dict: counts of generated / failed / cached / over_budget headlines
+    """
+    summary = {'generated': 0, 'failed': 0, 'cached': 0, 'over_budget': 0}
+    ranked = rank_headlines(fights, registry, score, date.today())
+
+    to_generate = []
+    remaining = token_budget
+    for fight in ranked:
+        event_url = registry.url_for(fight) or ''
+        event_slug = event_url.rsplit('/', 1)[-1] if fight.get('sport') == 'UFC' else None
+        if get_cached(fight_id(fight), legacy_preview_ids(fight, event_slug)):
+            summary['cached'] += 1
+        elif remaining >= tokens_per_preview:
+            remaining -= tokens_per_preview
+            to_generate.append(fight)
+        else:
+            summary['over_budget'] += 1
+
+    logger.info(
+        f"Preview pre-generation: {len(ranked)} headlines, {summary['cached']} cached, "
+        f"{len(to_generate)} to generate, {summary['over_budget']} over budget"
+    )
+
+    def run(fight):
+        try:
+            return generate(fight_id(fight), **job_for(fight))
+        except Exception as e:
+            logger.error(f"  ✗ Error generating preview for {fight['fighter1']} vs {fight['fighter2']}: {e}")
+            return None
+
+    if to_generate:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='preview-pregen') as pool:
+            # Submitted best-first, so the budget goes to the most prominent fights
+            for fight, preview in zip(to_generate, pool.map(run, to_generate)):
                 if preview:
-                    if preview.get('generated_at'):
-                        # Check if just generated (within last minute)
-                        from datetime import datetime, timedelta
-                        gen_time = datetime.fromisoformat(preview['generated_at'])
-                        if datetime.now() - gen_time < timedelta(minutes=1):
-                            generated += 1
-                            logger.info(f"  ✓ Generated: {fight['fighter1']} vs {fight['fighter2']}")
-                        else:
-                            skipped += 1
-                            logger.info(f"  ↻ Cached: {fight['fighter1']} vs {fight['fighter2']}")
+                    summary['generated'] += 1
+                    logger.info(f"  ✓ Generated: {fight['fighter1']} vs {fight['fighter2']}")
                 else:
+                    summary['failed'] += 1
                     logger.warning(f"  ✗ Failed: {fight['fighter1']} vs {fight['fighter2']}")
-                    
-            except Exception as e:
-                logger.error(f"  ✗ Error generating preview: {e}")
-                continue
-        
-        logger.info("=" * 60)
-        logger.info(f"PREVIEW GENERATION COMPLETE")
-        logger.info(f"  Generated: {generated}")
-        logger.info(f"  Cached: {skipped}")
-        logger.info(f"  Total: {generated + skipped}")
-        logger.info("=" * 60)
-        
-        return generated + skipped > 0
-        
-    except Exception as e:
-        logger.error(f"Preview generation failed: {e}")
-        return False
+
+    logger.info(
+        f"Preview pre-generation complete: {summary['generated']} generated, "
+        f"{summary['failed']} failed, {summary['cached']} cached"
+    )
+    return summary
+
 
 if __name__ == "__main__":
-    success = generate_all_previews()
-    sys.exit(0 if success else 1)
+    from app import run_preview_pregeneration
+
+    result = run_preview_pregeneration()
+    sys.exit(0 if result is not None and not result['failed'] else 1)
@@ -0,0 +1,145 @@
+"""
+Shared HTTP Client
+One pooled requests.Session for every outbound call (scrapers, ESPN API,
+admin image lookups, the preview API), so connections are kept alive and
+reused per host instead of paying a TCP+TLS handshake each time.
+
+Idempotent requests (GET/HEAD) are retried on connection errors and
+429/5xx with exponential backoff. Every request is recorded per host:
+request/error counts, status codes, and latency and response-size
+histograms, available from `http.stats()` (served under "hosts" at
+/admin/http-stats).
+"""
+
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger('fight_schedule')
+
+DEFAULT_TIMEOUT = (5, 15)  # (connect, read) seconds
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+SIZE_BUCKETS_BYTES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def _bucket_label(value, bounds, unit):
+    for bound in bounds:
+        if value <= bound:
+            return f"<={bound}{unit}"
+    return f">{bounds[-1]}{unit}"
+
+
+class HostStats:
+    """Counters and histograms for one host"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = {}          # exception class name -> count
+        self.statuses = {}        # status code -> count
+        self.latency_ms = {}      # bucket label -> count
+        self.size_bytes = {}      # bucket label -> count
+        self.total_ms = 0.0
+        self.total_bytes = 0
+
+    def record(self, elapsed_ms, status=None, size=None, error=None):
+        self.requests += 1
+        self.total_ms += elapsed_ms
+        label = _bucket_label(elapsed_ms, LATENCY_BUCKETS_MS, 'ms')
+        self.latency_ms[label] = self.latency_ms.get(label, 0) + 1
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        if status is not None:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+        if size is not None:
+            self.total_bytes += size
+            label = _bucket_label(size, SIZE_BUCKETS_BYTES, 'B')
+            self.size_bytes[label] = self.size_bytes.get(label, 0) + 1
+
+    def describe(self):
+        return {
+            'requests': self.requests,
+            'errors': dict(self.errors),
+            'statuses': {str(k): v for k, v in sorted(self.statuses.items())},
+            'avg_ms': round(self.total_ms / self.requests, 1) if self.requests else None,
+            'latency_ms': dict(self.latency_ms),
+            'total_bytes': self.total_bytes,
+            'size_bytes': dict(self.size_bytes),
+        }
+
+
+class HttpClient:
+    """Thread-safe pooled session with retries, default timeouts and per-host stats"""
+
+    def __init__(self, pool_maxsize=10, retries=2, backoff_factor=0.5, timeout=DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            backoff_factor=backoff_factor,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _record(self, url, elapsed_ms, status=None, size=None, error=None):
+        host = urlsplit(url).netloc or 'unknown'
+        with self._lock:
+            stats = self._stats.get(host)
+            if stats is None:
+                stats = self._stats[host] = HostStats()
+            stats.record(elapsed_ms, status, size, error)
+
+    def request(self, method, url, **kwargs):
+        """requests.request() through the shared session (raises like requests does)"""
+        kwargs.setdefault('timeout', self.timeout)
+        started = time.monotonic()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception as e:
+            self._record(url, (time.monotonic() - started) * 1000, error=type(e).__name__)
+            raise
+
+        elapsed_ms = (time.monotonic() - started) * 1000
+        if kwargs.get('stream'):
+            size = int(response.headers.get('content-length') or 0) or None
+        else:
+            size = len(response.content)
+        self._record(url, elapsed_ms, response.status_code, size)
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def stats(self):
+        """{host: stats dict} for every host contacted by this process"""
+        with self._lock:
+            return {host: stats.describe() for host, stats in sorted(self._stats.items())}
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+
+# Process-wide client used by every module
+http = HttpClient()
@@ -0,0 +1,191 @@
+"""
+Anthropic Messages API Client for AI Previews
+Calls go through the shared pooled session (http_client.py) with bounded
+retries (jittered exponential backoff, honouring Retry-After), a cap on
+concurrent calls, and a circuit breaker that fails fast while the API is
+unhealthy - so a preview can never hold a worker thread for much longer
+than `deadline` seconds.
+"""
+
+import logging
+import random
+import threading
+import time
+
+import requests
+
+from http_client import http as shared_http
+
+logger = logging.getLogger('fight_schedule')
+
+API_URL = "https://api.anthropic.com/v1/messages"
+API_VERSION = "2023-06-01"
+
+# 408/409/429 plus server errors (529 = overloaded) are worth another try
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures; while open every call fails
+    fast. After `reset_after` seconds one probe call is let through (half-open)
+    and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, threshold=5, reset_after=60.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if time.monotonic() - self._opened_at >= self.reset_after:
+                return 'half-open'
+            return 'open'
+
+    def allow(self):
+        """True if a call may go ahead now"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_after or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def release(self):
+        """Give up a probe slot from allow() without recording an outcome"""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.threshold:
+                if self._opened_at is None or self._probing:
+                    logger.warning(f"Preview API circuit opened after {self._failures} consecutive failures")
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class PreviewClient:
+    """Thread-safe client for single-message completions"""
+
+    def __init__(self, api_key, model, max_concurrency=4, max_attempts=3,
+                 connect_timeout=5.0, read_timeout=20.0, deadline=45.0,
+                 backoff_base=1.0, backoff_cap=8.0, breaker=None, http=None):
+        self.api_key = api_key
+        self.model = model
+        self.max_attempts = max(1, max_attempts)
+        self.timeout = (connect_timeout, read_timeout)
+        self.deadline = deadline
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.breaker = breaker or CircuitBreaker()
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        self.http = http or shared_http
+        # Sent per request - the shared session also talks to other hosts
+        self._headers = {
+            "Content-Type": "application/json",
+            "x-api-key": api_key,
+            "anthropic-version": API_VERSION,
+        }
+
+    def _backoff(self, attempt, retry_after=None):
+        """Full-jitter exponential backoff, or the server's Retry-After if given"""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_cap)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _retry_after(response):
+        try:
+            return float(response.headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return None
+
+    def complete(self, prompt, max_tokens):
+        """
+        Send one user message and return the reply text.
+
+        Returns None (never raises) if the circuit is open, every concurrency
+        slot stays busy, the API keeps failing, or the deadline runs out.
+        """
+        if not self.breaker.allow():
+            logger.warning("Preview API circuit open - skipping call")
+            return None
+
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=self.deadline):
+            logger.warning("Preview API concurrency limit reached - skipping call")
+            # Not the API's fault - but a half-open probe must not stay claimed
+            self.breaker.release()
+            return None
+
+        try:
+            for attempt in range(self.max_attempts):
+                # Time spent waiting for a slot or on earlier attempts counts too
+                remaining = self.deadline - (time.monotonic() - started)
+                if remaining <= 0:
+                    logger.warning("Preview API deadline reached")
+                    if attempt == 0:
+                        # Never reached the API - no outcome to record
+                        self.breaker.release()
+                        return None
+                    break
+                retry_after = None
+                try:
+                    response = self.http.post(
+                        API_URL,
+                        headers=self._headers,
+                        json={
+                            "model": self.model,
+                            "max_tokens": max_tokens,
+                            "messages": [{"role": "user", "content": prompt}],
+                        },
+                        timeout=(min(self.timeout[0], remaining), min(self.timeout[1], remaining)),
+                    )
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    logger.warning(f"Preview API attempt {attempt + 1} failed: {e}")
+                else:
+                    if response.status_code == 200:
+                        self.breaker.record_success()
+                        return response.json()['content'][0]['text']
+                    if response.status_code not in RETRYABLE_STATUS:
+                        # Bad request / auth problems won't fix themselves
+                        logger.error(f"API request failed: {response.status_code}")
+                        self.breaker.record_success()
+                        return None
+                    logger.warning(f"Preview API attempt {attempt + 1} returned {response.status_code}")
+                    retry_after = self._retry_after(response)
+
+                if attempt + 1 < self.max_attempts:
+                    delay = self._backoff(attempt, retry_after)
+                    if time.monotonic() - started + delay + self.timeout[1] > self.deadline:
+                        break
+                    time.sleep(delay)
+
+            self.breaker.record_failure()
+            return None
+        except Exception as e:
+            logger.error(f"Preview generation error: {e}")
+            self.breaker.record_failure()
+            return None
+        finally:
+            self._slots.release()
+
+    def describe(self):
+        """Client health for monitoring"""
+        return {'model': self.model, 'circuit': self.breaker.state}
@@ -0,0 +1,95 @@
+"""
+Background AI Preview Queue
+Event pages never wait on the Anthropic API: a preview cache miss is queued
+here and the page renders a placeholder that polls /api/preview/<id> until
+a worker thread has generated and saved it.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger('fight_schedule')
+
+
+class PreviewQueue:
+    """
+    Deduplicating job queue worked by a few daemon threads.
+
+    `generate(preview_id, **job)` must generate *and* persist the preview,
+    returning it (or None on failure). Threads start lazily on first submit
+    so gunicorn workers each get their own after forking.
+    """
+
+    def __init__(self, generate, workers=2, retry_after=600):
+        self._generate = generate
+        self.workers = max(1, workers)
+        self.retry_after = retry_after  # Seconds before a failed preview is retried
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._failed = {}    # preview_id -> time.monotonic() of the failure
+        self._pid = None
+
+    def _ensure_workers(self):
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        for i in range(self.workers):
+            threading.Thread(target=self._worker, name=f'preview-worker-{i}', daemon=True).start()
+
+    def status(self, preview_id):
+        """'pending', 'failed' (within retry_after), or None if unknown here"""
+        with self._lock:
+            if preview_id in self._pending:
+                return 'pending'
+            failed_at = self._failed.get(preview_id)
+            if failed_at is not None and time.monotonic() - failed_at < self.retry_after:
+                return 'failed'
+            return None
+
+    def submit(self, preview_id, **job):
+        """
+        Queue a preview unless it is already queued or recently failed.
+
+        Returns:
+            str: 'pending' or 'failed'
+        """
+        with self._lock:
+            if preview_id in self._pending:
+                return 'pending'
+            failed_at = self._failed.get(preview_id)
+            if failed_at is not None and time.monotonic() - failed_at < self.retry_after:
+                return 'failed'
+            self._failed.pop(preview_id, None)
+            self._pending.add(preview_id)
+            self._ensure_workers()
+        self._queue.put((preview_id, job))
+        logger.info(f"Queued AI preview {preview_id} ({self._queue.qsize()} waiting)")
+        return 'pending'
+
+    def describe(self):
+        """Queue state for monitoring"""
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'waiting': self._queue.qsize(),
+                'pending': sorted(self._pending),
+                'recent_failures': len(self._failed),
+            }
+
+    def _worker(self):
+        while True:
+            preview_id, job = self._queue.get()
+            try:
+                preview = self._generate(preview_id, **job)
+            except Exception as e:
+                logger.error(f"Preview job {preview_id} crashed: {e}", exc_info=True)
+                preview = None
+            with self._lock:
+                self._pending.discard(preview_id)
+                if preview is None:
+                    self._failed[preview_id] = time.monotonic()
+            self._queue.task_done()
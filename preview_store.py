@@ -0,0 +1,135 @@
+"""
+AI Preview Store
+SQLite (WAL mode) table of generated previews keyed by preview_id, so page
+views do point lookups and new previews are single-row upserts instead of
+re-parsing and rewriting all of fight_previews.json. Safe to share between
+gunicorn workers; each thread keeps its own connection.
+
+On first use the legacy fight_previews.json is imported once (the file is
+left in place as a backup).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+logger = logging.getLogger('fight_schedule')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS previews (
+    preview_id  TEXT PRIMARY KEY,
+    data        TEXT NOT NULL,
+    updated_at  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key    TEXT PRIMARY KEY,
+    value  TEXT NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', '0');
+"""
+
+
+class PreviewStore:
+    """Keyed preview storage with a revision counter that changes on every write"""
+
+    def __init__(self, db_path, legacy_json_path=None, busy_timeout=10.0):
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        if legacy_json_path:
+            self._import_legacy(legacy_json_path)
+
+    def _conn(self):
+        """This thread's connection (reopened after fork)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _write(self, statements):
+        """Run (sql, params) pairs in one transaction and bump the revision"""
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for sql, params in statements:
+                conn.execute(sql, params)
+            conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision'")
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    def _import_legacy(self, json_path):
+        conn = self._conn()
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+            return
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except FileNotFoundError:
+            legacy = {}
+        except Exception as e:
+            logger.warning(f"Could not read legacy previews {json_path}: {e}")
+            return
+
+        now = datetime.now().isoformat()
+        statements = [
+            ('INSERT OR IGNORE INTO previews (preview_id, data, updated_at) VALUES (?, ?, ?)',
+             (preview_id, json.dumps(data, ensure_ascii=False), now))
+            for preview_id, data in legacy.items()
+        ]
+        # Another worker may import concurrently; the marker makes it one-shot
+        statements.append(("INSERT OR IGNORE INTO meta (key, value) VALUES ('legacy_imported', ?)", (now,)))
+        self._write(statements)
+        if legacy:
+            logger.info(f"Imported {len(legacy)} previews from {json_path}")
+
+    def get(self, preview_id):
+        """Preview dict, or None"""
+        row = self._conn().execute('SELECT data FROM previews WHERE preview_id = ?', (preview_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_first(self, preview_ids):
+        """(preview_id, preview) for the first id that exists, or (None, None)"""
+        for preview_id in preview_ids:
+            preview = self.get(preview_id)
+            if preview is not None:
+                return preview_id, preview
+        return None, None
+
+    def put(self, preview_id, data):
+        """Insert or replace one preview"""
+        self._write([(
+            'INSERT OR REPLACE INTO previews (preview_id, data, updated_at) VALUES (?, ?, ?)',
+            (preview_id, json.dumps(data, ensure_ascii=False), datetime.now().isoformat()),
+        )])
+
+    def updated_at(self, preview_id):
+        """ISO timestamp of the preview's last write, or None if it isn't stored"""
+        row = self._conn().execute('SELECT updated_at FROM previews WHERE preview_id = ?', (preview_id,)).fetchone()
+        return row[0] if row else None
+
+    def delete(self, preview_id):
+        self._write([('DELETE FROM previews WHERE preview_id = ?', (preview_id,))])
+
+    def all(self):
+        """Every preview as {preview_id: data}"""
+        rows = self._conn().execute('SELECT preview_id, data FROM previews').fetchall()
+        return {preview_id: json.loads(data) for preview_id, data in rows}
+
+    @property
+    def version(self):
+        """Revision counter; changes whenever any worker writes a preview"""
+        row = self._conn().execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        return int(row[0]) if row else 0
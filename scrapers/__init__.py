@@ -5,5 +5,21 @@ Contains all event scraping modules for different fight sources
 
 from .ufc_scraper import scrape_ufc_events
 from .boxing_scraper import scrape_boxing_events
+from .registry import ScraperSource, SourceResult, register_source, get_sources, run_sources
+from .merge import merge_fights
 
-__all__ = ['scrape_ufc_events', 'scrape_boxing_events']
+# Fight sources, in merge order. Adding a source is one register_source() call.
+register_source(ScraperSource(
+    'boxingschedule', 'BoxingSchedule.co', 'Boxing', scrape_boxing_events,
+    timeout=60, min_fights=5,
+))
+register_source(ScraperSource(
+    'mmafighting', 'MMA Fighting UFC', 'UFC', scrape_ufc_events,
+    timeout=60, min_fights=10,
+))
+
+__all__ = [
+    'scrape_ufc_events', 'scrape_boxing_events',
+    'ScraperSource', 'SourceResult', 'register_source', 'get_sources', 'run_sources',
+    'merge_fights',
+]
@@ -16,9 +16,10 @@ Three API layers:
              https://sports.core.api.espn.com/v2/sports/{sport}/leagues/{league}/{resource}
 """
 
-import requests
 import logging
 
+from http_client import http
+
 logger = logging.getLogger('fight_schedule')
 
 SITE_URL = "https://site.api.espn.com/apis/site/v2/sports"
@@ -33,7 +34,7 @@ TIMEOUT = 15
 def _get(url, params=None):
     """Make a GET request and return JSON, or None on failure."""
     try:
-        resp = requests.get(url, headers=HEADERS, params=params, timeout=TIMEOUT)
+        resp = http.get(url, headers=HEADERS, params=params, timeout=TIMEOUT)
         resp.raise_for_status()
         return resp.json()
     except Exception as e:
@@ -0,0 +1,482 @@
+"""
+Offline Venue Gazetteer
+Countries, states/provinces and the cities boxing and MMA cards are held
+in, each mapped to an IANA timezone, plus the local time main cards
+usually start in each country. Used to estimate a start time when a
+schedule lists a venue but no time.
+
+Lookups go through a token index (first word of every place name), so
+resolving a venue string costs O(words in the string); results are cached
+per string.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from fight_ids import normalize_name
+
+Place = namedtuple('Place', 'name country zone level')
+
+COUNTRY, REGION, CITY = 0, 1, 2
+
+# country -> (IANA zone, typical local main card start, other names)
+COUNTRIES = {
+    'us': ('America/New_York', '21:00', ('us', 'usa', 'united states', 'united states of america')),
+    'ca': ('America/Toronto', '21:00', ('canada',)),
+    'mx': ('America/Mexico_City', '21:00', ('mexico',)),
+    'pr': ('America/Puerto_Rico', '21:00', ('puerto rico',)),
+    'do': ('America/Santo_Domingo', '21:00', ('dominican republic',)),
+    'pa': ('America/Panama', '21:00', ('panama',)),
+    'ni': ('America/Managua', '21:00', ('nicaragua',)),
+    'cu': ('America/Havana', '21:00', ('cuba',)),
+    'co': ('America/Bogota', '21:00', ('colombia',)),
+    've': ('America/Caracas', '21:00', ('venezuela',)),
+    'pe': ('America/Lima', '21:00', ('peru',)),
+    'cl': ('America/Santiago', '21:00', ('chile',)),
+    'ar': ('America/Argentina/Buenos_Aires', '22:00', ('argentina',)),
+    'br': ('America/Sao_Paulo', '21:00', ('brazil', 'brasil')),
+    'gb': ('Europe/London', '22:00', ('uk', 'united kingdom', 'great britain', 'britain',
+                                      'england', 'scotland', 'wales', 'northern ireland')),
+    'ie': ('Europe/Dublin', '22:00', ('ireland', 'republic of ireland')),
+    'fr': ('Europe/Paris', '22:00', ('france',)),
+    'mc': ('Europe/Monaco', '22:00', ('monaco',)),
+    'de': ('Europe/Berlin', '22:00', ('germany',)),
+    'it': ('Europe/Rome', '22:00', ('italy',)),
+    'es': ('Europe/Madrid', '22:00', ('spain',)),
+    'pt': ('Europe/Lisbon', '22:00', ('portugal',)),
+    'nl': ('Europe/Amsterdam', '22:00', ('netherlands', 'holland')),
+    'be': ('Europe/Brussels', '22:00', ('belgium',)),
+    'ch': ('Europe/Zurich', '22:00', ('switzerland',)),
+    'at': ('Europe/Vienna', '22:00', ('austria',)),
+    'dk': ('Europe/Copenhagen', '22:00', ('denmark',)),
+    'se': ('Europe/Stockholm', '22:00', ('sweden',)),
+    'no': ('Europe/Oslo', '22:00', ('norway',)),
+    'fi': ('Europe/Helsinki', '22:00', ('finland',)),
+    'pl': ('Europe/Warsaw', '22:00', ('poland',)),
+    'cz': ('Europe/Prague', '22:00', ('czech republic', 'czechia')),
+    'hu': ('Europe/Budapest', '22:00', ('hungary',)),
+    'ro': ('Europe/Bucharest', '22:00', ('romania',)),
+    'bg': ('Europe/Sofia', '22:00', ('bulgaria',)),
+    'rs': ('Europe/Belgrade', '22:00', ('serbia',)),
+    'hr': ('Europe/Zagreb', '22:00', ('croatia',)),
+    'gr': ('Europe/Athens', '22:00', ('greece',)),
+    'lv': ('Europe/Riga', '22:00', ('latvia',)),
+    'lt': ('Europe/Vilnius', '22:00', ('lithuania',)),
+    'ua': ('Europe/Kyiv', '22:00', ('ukraine',)),
+    'ru': ('Europe/Moscow', '22:00', ('russia',)),
+    'tr': ('Europe/Istanbul', '22:00', ('turkey', 'turkiye')),
+    'kz': ('Asia/Almaty', '21:00', ('kazakhstan',)),
+    'uz': ('Asia/Tashkent', '21:00', ('uzbekistan',)),
+    'ae': ('Asia/Dubai', '21:00', ('uae', 'united arab emirates')),
+    'sa': ('Asia/Riyadh', '20:00', ('saudi arabia', 'ksa')),
+    'qa': ('Asia/Qatar', '21:00', ('qatar',)),
+    'bh': ('Asia/Bahrain', '21:00', ('bahrain',)),
+    'kw': ('Asia/Kuwait', '21:00', ('kuwait',)),
+    'eg': ('Africa/Cairo', '21:00', ('egypt',)),
+    'ma': ('Africa/Casablanca', '21:00', ('morocco',)),
+    'ng': ('Africa/Lagos', '21:00', ('nigeria',)),
+    'gh': ('Africa/Accra', '21:00', ('ghana',)),
+    'za': ('Africa/Johannesburg', '21:00', ('south africa',)),
+    'in': ('Asia/Kolkata', '20:00', ('india',)),
+    'th': ('Asia/Bangkok', '20:00', ('thailand',)),
+    'ph': ('Asia/Manila', '20:00', ('philippines',)),
+    'sg': ('Asia/Singapore', '20:00', ('singapore',)),
+    'cn': ('Asia/Shanghai', '20:00', ('china',)),
+    'hk': ('Asia/Hong_Kong', '20:00', ('hong kong',)),
+    'mo': ('Asia/Macau', '20:00', ('macau', 'macao')),
+    'kr': ('Asia/Seoul', '19:00', ('south korea', 'korea')),
+    'jp': ('Asia/Tokyo', '19:00', ('japan',)),
+    'au': ('Australia/Sydney', '20:00', ('australia',)),
+    'nz': ('Pacific/Auckland', '20:00', ('new zealand',)),
+}
+
+# US and Canadian cards are scheduled for the east-coast broadcast
+# (e.g. 9 PM ET / 6 PM PT), whatever the venue's own timezone
+BROADCAST_ZONES = {
+    'us': 'America/New_York',
+    'ca': 'America/Toronto',
+}
+
+# state/province -> (country, IANA zone, postal code or None)
+REGIONS = {
+    'alabama': ('us', 'America/Chicago', 'al'),
+    'alaska': ('us', 'America/Anchorage', 'ak'),
+    'arizona': ('us', 'America/Phoenix', 'az'),
+    'arkansas': ('us', 'America/Chicago', 'ar'),
+    'california': ('us', 'America/Los_Angeles', 'ca'),
+    'colorado': ('us', 'America/Denver', 'co'),
+    'connecticut': ('us', 'America/New_York', 'ct'),
+    'delaware': ('us', 'America/New_York', 'de'),
+    'district of columbia': ('us', 'America/New_York', 'dc'),
+    'florida': ('us', 'America/New_York', 'fl'),
+    'georgia': ('us', 'America/New_York', 'ga'),
+    'hawaii': ('us', 'Pacific/Honolulu', 'hi'),
+    'idaho': ('us', 'America/Boise', 'id'),
+    'illinois': ('us', 'America/Chicago', 'il'),
+    'indiana': ('us', 'America/Indiana/Indianapolis', 'in'),
+    'iowa': ('us', 'America/Chicago', 'ia'),
+    'kansas': ('us', 'America/Chicago', 'ks'),
+    'kentucky': ('us', 'America/New_York', 'ky'),
+    'louisiana': ('us', 'America/Chicago', 'la'),
+    'maine': ('us', 'America/New_York', 'me'),
+    'maryland': ('us', 'America/New_York', 'md'),
+    'massachusetts': ('us', 'America/New_York', 'ma'),
+    'michigan': ('us', 'America/Detroit', 'mi'),
+    'minnesota': ('us', 'America/Chicago', 'mn'),
+    'mississippi': ('us', 'America/Chicago', 'ms'),
+    'missouri': ('us', 'America/Chicago', 'mo'),
+    'montana': ('us', 'America/Denver', 'mt'),
+    'nebraska': ('us', 'America/Chicago', 'ne'),
+    'nevada': ('us', 'America/Los_Angeles', 'nv'),
+    'new hampshire': ('us', 'America/New_York', 'nh'),
+    'new jersey': ('us', 'America/New_York', 'nj'),
+    'new mexico': ('us', 'America/Denver', 'nm'),
+    'new york': ('us', 'America/New_York', 'ny'),
+    'north carolina': ('us', 'America/New_York', 'nc'),
+    'north dakota': ('us', 'America/Chicago', 'nd'),
+    'ohio': ('us', 'America/New_York', 'oh'),
+    'oklahoma': ('us', 'America/Chicago', 'ok'),
+    'oregon': ('us', 'America/Los_Angeles', 'or'),
+    'pennsylvania': ('us', 'America/New_York', 'pa'),
+    'rhode island': ('us', 'America/New_York', 'ri'),
+    'south carolina': ('us', 'America/New_York', 'sc'),
+    'south dakota': ('us', 'America/Chicago', 'sd'),
+    'tennessee': ('us', 'America/Chicago', 'tn'),
+    'texas': ('us', 'America/Chicago', 'tx'),
+    'utah': ('us', 'America/Denver', 'ut'),
+    'vermont': ('us', 'America/New_York', 'vt'),
+    'virginia': ('us', 'America/New_York', 'va'),
+    'washington': ('us', 'America/Los_Angeles', 'wa'),
+    'west virginia': ('us', 'America/New_York', 'wv'),
+    'wisconsin': ('us', 'America/Chicago', 'wi'),
+    'wyoming': ('us', 'America/Denver', 'wy'),
+    'ontario': ('ca', 'America/Toronto', 'on'),
+    'quebec': ('ca', 'America/Toronto', 'qc'),
+    'british columbia': ('ca', 'America/Vancouver', 'bc'),
+    'alberta': ('ca', 'America/Edmonton', 'ab'),
+    'manitoba': ('ca', 'America/Winnipeg', 'mb'),
+    'saskatchewan': ('ca', 'America/Regina', 'sk'),
+    'nova scotia': ('ca', 'America/Halifax', 'ns'),
+    'new brunswick': ('ca', 'America/Moncton', 'nb'),
+    'newfoundland': ('ca', 'America/St_Johns', 'nl'),
+    'new south wales': ('au', 'Australia/Sydney', None),
+    'victoria': ('au', 'Australia/Melbourne', None),
+    'queensland': ('au', 'Australia/Brisbane', None),
+    'western australia': ('au', 'Australia/Perth', None),
+    'south australia': ('au', 'Australia/Adelaide', None),
+    'tasmania': ('au', 'Australia/Hobart', None),
+    'northern territory': ('au', 'Australia/Darwin', None),
+}
+
+# city -> (country, IANA zone)
+CITIES = {
+    # United States
+    'las vegas': ('us', 'America/Los_Angeles'),
+    'paradise': ('us', 'America/Los_Angeles'),
+    'reno': ('us', 'America/Los_Angeles'),
+    'los angeles': ('us', 'America/Los_Angeles'),
+    'inglewood': ('us', 'America/Los_Angeles'),
+    'carson': ('us', 'America/Los_Angeles'),
+    'anaheim': ('us', 'America/Los_Angeles'),
+    'san diego': ('us', 'America/Los_Angeles'),
+    'san francisco': ('us', 'America/Los_Angeles'),
+    'san jose': ('us', 'America/Los_Angeles'),
+    'sacramento': ('us', 'America/Los_Angeles'),
+    'fresno': ('us', 'America/Los_Angeles'),
+    'seattle': ('us', 'America/Los_Angeles'),
+    'portland': ('us', 'America/Los_Angeles'),
+    'phoenix': ('us', 'America/Phoenix'),
+    'glendale': ('us', 'America/Phoenix'),
+    'tucson': ('us', 'America/Phoenix'),
+    'denver': ('us', 'America/Denver'),
+    'salt lake city': ('us', 'America/Denver'),
+    'albuquerque': ('us', 'America/Denver'),
+    'el paso': ('us', 'America/Denver'),
+    'houston': ('us', 'America/Chicago'),
+    'dallas': ('us', 'America/Chicago'),
+    'arlington': ('us', 'America/Chicago'),
+    'frisco': ('us', 'America/Chicago'),
+    'fort worth': ('us', 'America/Chicago'),
+    'san antonio': ('us', 'America/Chicago'),
+    'austin': ('us', 'America/Chicago'),
+    'corpus christi': ('us', 'America/Chicago'),
+    'chicago': ('us', 'America/Chicago'),
+    'minneapolis': ('us', 'America/Chicago'),
+    'milwaukee': ('us', 'America/Chicago'),
+    'st louis': ('us', 'America/Chicago'),
+    'kansas city': ('us', 'America/Chicago'),
+    'nashville': ('us', 'America/Chicago'),
+    'memphis': ('us', 'America/Chicago'),
+    'new orleans': ('us', 'America/Chicago'),
+    'oklahoma city': ('us', 'America/Chicago'),
+    'tulsa': ('us', 'America/Chicago'),
+    'new york city': ('us', 'America/New_York'),
+    'brooklyn': ('us', 'America/New_York'),
+    'manhattan': ('us', 'America/New_York'),
+    'newark': ('us', 'America/New_York'),
+    'atlantic city': ('us', 'America/New_York'),
+    'philadelphia': ('us', 'America/New_York'),
+    'pittsburgh': ('us', 'America/New_York'),
+    'boston': ('us', 'America/New_York'),
+    'uncasville': ('us', 'America/New_York'),
+    'mashantucket': ('us', 'America/New_York'),
+    'washington dc': ('us', 'America/New_York'),
+    'baltimore': ('us', 'America/New_York'),
+    'atlanta': ('us', 'America/New_York'),
+    'miami': ('us', 'America/New_York'),
+    'orlando': ('us', 'America/New_York'),
+    'tampa': ('us', 'America/New_York'),
+    'jacksonville': ('us', 'America/New_York'),
+    'charlotte': ('us', 'America/New_York'),
+    'detroit': ('us', 'America/Detroit'),
+    'cleveland': ('us', 'America/New_York'),
+    'columbus': ('us', 'America/New_York'),
+    'cincinnati': ('us', 'America/New_York'),
+    'indianapolis': ('us', 'America/Indiana/Indianapolis'),
+    'honolulu': ('us', 'Pacific/Honolulu'),
+    'anchorage': ('us', 'America/Anchorage'),
+    # Canada
+    'toronto': ('ca', 'America/Toronto'),
+    'montreal': ('ca', 'America/Toronto'),
+    'laval': ('ca', 'America/Toronto'),
+    'quebec city': ('ca', 'America/Toronto'),
+    'ottawa': ('ca', 'America/Toronto'),
+    'vancouver': ('ca', 'America/Vancouver'),
+    'calgary': ('ca', 'America/Edmonton'),
+    'edmonton': ('ca', 'America/Edmonton'),
+    'winnipeg': ('ca', 'America/Winnipeg'),
+    'halifax': ('ca', 'America/Halifax'),
+    # Mexico, Caribbean, Central and South America
+    'mexico city': ('mx', 'America/Mexico_City'),
+    'ciudad de mexico': ('mx', 'America/Mexico_City'),
+    'guadalajara': ('mx', 'America/Mexico_City'),
+    'monterrey': ('mx', 'America/Monterrey'),
+    'puebla': ('mx', 'America/Mexico_City'),
+    'leon': ('mx', 'America/Mexico_City'),
+    'aguascalientes': ('mx', 'America/Mexico_City'),
+    'acapulco': ('mx', 'America/Mexico_City'),
+    'merida': ('mx', 'America/Merida'),
+    'cancun': ('mx', 'America/Cancun'),
+    'tijuana': ('mx', 'America/Tijuana'),
+    'mexicali': ('mx', 'America/Tijuana'),
+    'hermosillo': ('mx', 'America/Hermosillo'),
+    'culiacan': ('mx', 'America/Mazatlan'),
+    'mazatlan': ('mx', 'America/Mazatlan'),
+    'los mochis': ('mx', 'America/Mazatlan'),
+    'san juan': ('pr', 'America/Puerto_Rico'),
+    'bayamon': ('pr', 'America/Puerto_Rico'),
+    'santo domingo': ('do', 'America/Santo_Domingo'),
+    'panama city': ('pa', 'America/Panama'),
+    'managua': ('ni', 'America/Managua'),
+    'havana': ('cu', 'America/Havana'),
+    'bogota': ('co', 'America/Bogota'),
+    'barranquilla': ('co', 'America/Bogota'),
+    'caracas': ('ve', 'America/Caracas'),
+    'lima': ('pe', 'America/Lima'),
+    'buenos aires': ('ar', 'America/Argentina/Buenos_Aires'),
+    'sao paulo': ('br', 'America/Sao_Paulo'),
+    'rio de janeiro': ('br', 'America/Sao_Paulo'),
+    # UK and Ireland
+    'london': ('gb', 'Europe/London'),
+    'wembley': ('gb', 'Europe/London'),
+    'manchester': ('gb', 'Europe/London'),
+    'liverpool': ('gb', 'Europe/London'),
+    'birmingham': ('gb', 'Europe/London'),
+    'sheffield': ('gb', 'Europe/London'),
+    'leeds': ('gb', 'Europe/London'),
+    'newcastle': ('gb', 'Europe/London'),
+    'nottingham': ('gb', 'Europe/London'),
+    'leicester': ('gb', 'Europe/London'),
+    'bristol': ('gb', 'Europe/London'),
+    'bournemouth': ('gb', 'Europe/London'),
+    'brighton': ('gb', 'Europe/London'),
+    'hull': ('gb', 'Europe/London'),
+    'bolton': ('gb', 'Europe/London'),
+    'wolverhampton': ('gb', 'Europe/London'),
+    'coventry': ('gb', 'Europe/London'),
+    'derby': ('gb', 'Europe/London'),
+    'glasgow': ('gb', 'Europe/London'),
+    'edinburgh': ('gb', 'Europe/London'),
+    'aberdeen': ('gb', 'Europe/London'),
+    'cardiff': ('gb', 'Europe/London'),
+    'swansea': ('gb', 'Europe/London'),
+    'belfast': ('gb', 'Europe/London'),
+    'dublin': ('ie', 'Europe/Dublin'),
+    'cork': ('ie', 'Europe/Dublin'),
+    'limerick': ('ie', 'Europe/Dublin'),
+    'galway': ('ie', 'Europe/Dublin'),
+    # Europe
+    'paris': ('fr', 'Europe/Paris'),
+    'marseille': ('fr', 'Europe/Paris'),
+    'lyon': ('fr', 'Europe/Paris'),
+    'nice': ('fr', 'Europe/Paris'),
+    'monte carlo': ('mc', 'Europe/Monaco'),
+    'berlin': ('de', 'Europe/Berlin'),
+    'hamburg': ('de', 'Europe/Berlin'),
+    'munich': ('de', 'Europe/Berlin'),
+    'cologne': ('de', 'Europe/Berlin'),
+    'dusseldorf': ('de', 'Europe/Berlin'),
+    'frankfurt': ('de', 'Europe/Berlin'),
+    'stuttgart': ('de', 'Europe/Berlin'),
+    'magdeburg': ('de', 'Europe/Berlin'),
+    'rome': ('it', 'Europe/Rome'),
+    'milan': ('it', 'Europe/Rome'),
+    'madrid': ('es', 'Europe/Madrid'),
+    'barcelona': ('es', 'Europe/Madrid'),
+    'valencia': ('es', 'Europe/Madrid'),
+    'bilbao': ('es', 'Europe/Madrid'),
+    'lisbon': ('pt', 'Europe/Lisbon'),
+    'amsterdam': ('nl', 'Europe/Amsterdam'),
+    'rotterdam': ('nl', 'Europe/Amsterdam'),
+    'brussels': ('be', 'Europe/Brussels'),
+    'antwerp': ('be', 'Europe/Brussels'),
+    'zurich': ('ch', 'Europe/Zurich'),
+    'geneva': ('ch', 'Europe/Zurich'),
+    'vienna': ('at', 'Europe/Vienna'),
+    'copenhagen': ('dk', 'Europe/Copenhagen'),
+    'stockholm': ('se', 'Europe/Stockholm'),
+    'oslo': ('no', 'Europe/Oslo'),
+    'helsinki': ('fi', 'Europe/Helsinki'),
+    'warsaw': ('pl', 'Europe/Warsaw'),
+    'krakow': ('pl', 'Europe/Warsaw'),
+    'gdansk': ('pl', 'Europe/Warsaw'),
+    'prague': ('cz', 'Europe/Prague'),
+    'budapest': ('hu', 'Europe/Budapest'),
+    'bucharest': ('ro', 'Europe/Bucharest'),
+    'sofia': ('bg', 'Europe/Sofia'),
+    'belgrade': ('rs', 'Europe/Belgrade'),
+    'zagreb': ('hr', 'Europe/Zagreb'),
+    'athens': ('gr', 'Europe/Athens'),
+    'riga': ('lv', 'Europe/Riga'),
+    'vilnius': ('lt', 'Europe/Vilnius'),
+    'kyiv': ('ua', 'Europe/Kyiv'),
+    'kiev': ('ua', 'Europe/Kyiv'),
+    'moscow': ('ru', 'Europe/Moscow'),
+    'saint petersburg': ('ru', 'Europe/Moscow'),
+    'yekaterinburg': ('ru', 'Asia/Yekaterinburg'),
+    'istanbul': ('tr', 'Europe/Istanbul'),
+    # Middle East and Africa
+    'dubai': ('ae', 'Asia/Dubai'),
+    'abu dhabi': ('ae', 'Asia/Dubai'),
+    'riyadh': ('sa', 'Asia/Riyadh'),
+    'diriyah': ('sa', 'Asia/Riyadh'),
+    'jeddah': ('sa', 'Asia/Riyadh'),
+    'doha': ('qa', 'Asia/Qatar'),
+    'manama': ('bh', 'Asia/Bahrain'),
+    'kuwait city': ('kw', 'Asia/Kuwait'),
+    'cairo': ('eg', 'Africa/Cairo'),
+    'lagos': ('ng', 'Africa/Lagos'),
+    'accra': ('gh', 'Africa/Accra'),
+    'johannesburg': ('za', 'Africa/Johannesburg'),
+    'durban': ('za', 'Africa/Johannesburg'),
+    'cape town': ('za', 'Africa/Johannesburg'),
+    # Asia and Oceania
+    'almaty': ('kz', 'Asia/Almaty'),
+    'astana': ('kz', 'Asia/Almaty'),
+    'tashkent': ('uz', 'Asia/Tashkent'),
+    'mumbai': ('in', 'Asia/Kolkata'),
+    'delhi': ('in', 'Asia/Kolkata'),
+    'bangkok': ('th', 'Asia/Bangkok'),
+    'manila': ('ph', 'Asia/Manila'),
+    'cebu': ('ph', 'Asia/Manila'),
+    'beijing': ('cn', 'Asia/Shanghai'),
+    'shanghai': ('cn', 'Asia/Shanghai'),
+    'tokyo': ('jp', 'Asia/Tokyo'),
+    'saitama': ('jp', 'Asia/Tokyo'),
+    'yokohama': ('jp', 'Asia/Tokyo'),
+    'osaka': ('jp', 'Asia/Tokyo'),
+    'nagoya': ('jp', 'Asia/Tokyo'),
+    'kobe': ('jp', 'Asia/Tokyo'),
+    'seoul': ('kr', 'Asia/Seoul'),
+    'sydney': ('au', 'Australia/Sydney'),
+    'canberra': ('au', 'Australia/Sydney'),
+    'melbourne': ('au', 'Australia/Melbourne'),
+    'brisbane': ('au', 'Australia/Brisbane'),
+    'gold coast': ('au', 'Australia/Brisbane'),
+    'perth': ('au', 'Australia/Perth'),
+    'adelaide': ('au', 'Australia/Adelaide'),
+    'hobart': ('au', 'Australia/Hobart'),
+    'darwin': ('au', 'Australia/Darwin'),
+    'auckland': ('nz', 'Pacific/Auckland'),
+    'wellington': ('nz', 'Pacific/Auckland'),
+}
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def _tokens(text):
+    return tuple(_TOKEN_RE.findall(normalize_name(text)))
+
+
+def _build_index():
+    """first token -> [(name tokens, Place)], longest names first"""
+    places = []
+    for country, (zone, _, names) in COUNTRIES.items():
+        places.extend(Place(name, country, zone, COUNTRY) for name in names)
+    for name, (country, zone, _) in REGIONS.items():
+        places.append(Place(name, country, zone, REGION))
+    for name, (country, zone) in CITIES.items():
+        places.append(Place(name, country, zone, CITY))
+
+    index = {}
+    for place in places:
+        tokens = _tokens(place.name)
+        index.setdefault(tokens[0], []).append((tokens, place))
+    for candidates in index.values():
+        candidates.sort(key=lambda item: -len(item[0]))
+    return index
+
+
+_INDEX = _build_index()
+
+# Postal codes only count as the last comma-separated part ("Las Vegas, NV")
+_REGION_CODES = {
+    code: Place(name, country, zone, REGION)
+    for name, (country, zone, code) in REGIONS.items() if code
+}
+
+
+@lru_cache(maxsize=2048)
+def lookup_venue(venue_text):
+    """
+    Best-matching Place for a venue/location string, or None.
+
+    The right-most place named decides the country ("Ontario, CA" is in
+    California); within that country the most specific match (city, then
+    state, then country) gives the timezone. A trailing state code only
+    counts when every other match is in the US or Canada.
+    """
+    if not venue_text:
+        return None
+
+    tokens = _tokens(venue_text)
+    matches = []
+    i = 0
+    while i < len(tokens):
+        for name_tokens, place in _INDEX.get(tokens[i], ()):
+            if tokens[i:i + len(name_tokens)] == name_tokens:
+                matches.append(place)
+                i += len(name_tokens)
+                break
+        else:
+            i += 1
+
+    # A trailing two-letter code is only read as a US/Canadian state if
+    # nothing else points abroad ("Berlin, DE" is Germany, not Delaware)
+    if ',' in venue_text:
+        last_part = _tokens(venue_text.rsplit(',', 1)[1])
+        if (len(last_part) == 1 and last_part[0] in _REGION_CODES
+                and all(p.country in BROADCAST_ZONES for p in matches)):
+            matches.append(_REGION_CODES[last_part[0]])
+
+    if not matches:
+        return None
+    country = matches[-1].country
+    return max((p for p in matches if p.country == country), key=lambda p: p.level)
+
+
+def main_card_start(place):
+    """(IANA zone, 'HH:MM') a main card at `place` usually starts at"""
+    _, start, _ = COUNTRIES[place.country]
+    return BROADCAST_ZONES.get(place.country, place.zone), start
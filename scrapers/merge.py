@@ -0,0 +1,135 @@
+"""
+Multi-Source Fight Merge
+Joins the fight lists of every source into one list without duplicate
+cards. Fights match when they are the same sport, the same two fighters
+(normalized, in either order) and dates at most one day apart - sources
+disagree on the date when a card crosses midnight UTC.
+
+Matching is a hash join: each merged fight is indexed under
+(sport, fighter pair, date), and every incoming fight probes the three
+keys for date-1, date and date+1. A refresh is therefore linear in the
+number of fights however many sources are enabled.
+
+Each merged fight records which sources listed it (`sources`) and which
+source each field's value came from (`provenance`).
+
+Only listings from different sources are merged: two listings from the
+same source are separate bouts, however alike. Placeholder matchups
+("TBA vs TBA") are never merged.
+"""
+
+from datetime import date, timedelta
+
+from fight_ids import normalize_name
+
+# Values that mean "this source doesn't know"
+_MISSING = (None, '', 'TBA', False)
+
+# Chosen together, from the source with the most reliable start time
+_TIME_FIELDS = ('date', 'time', 'time_estimated')
+
+# Merge bookkeeping stored on each fight (not needed to render pages)
+PROVENANCE_FIELDS = ('sources', 'provenance')
+
+# Never merged
+_SKIP_FIELDS = PROVENANCE_FIELDS + ('fight_id', 'event_id')
+
+# Fighter names that stand for "not announced yet"
+_PLACEHOLDER_NAMES = ('', 'tba', 'tbd', 'tbc')
+
+
+def _present(value):
+    return value not in _MISSING and value != []
+
+
+def _time_rank(fight):
+    """2 = scraped start time, 1 = estimated, 0 = none"""
+    if not _present(fight.get('time')):
+        return 0
+    return 1 if fight.get('time_estimated') else 2
+
+
+def _dates(fight):
+    """The fight's date and the day either side (or just the raw value if it isn't a date)"""
+    raw = fight.get('date')
+    try:
+        day = date.fromisoformat(raw)
+    except (TypeError, ValueError):
+        return [raw]
+    return [day.isoformat(), (day - timedelta(days=1)).isoformat(), (day + timedelta(days=1)).isoformat()]
+
+
+def _pair(fight):
+    return tuple(sorted((normalize_name(fight.get('fighter1')), normalize_name(fight.get('fighter2')))))
+
+
+def _combine(listings):
+    """One fight from [(source, fight)] listings in source priority order"""
+    primary_source, primary = listings[0]
+    merged = {}
+    provenance = {}
+
+    fields = []
+    for _, fight in listings:
+        fields.extend(k for k in fight if k not in fields and k not in _SKIP_FIELDS)
+
+    for field in fields:
+        if field in _TIME_FIELDS:
+            continue
+        # First source (in priority order) that has a real value wins
+        for source, fight in listings:
+            if _present(fight.get(field)):
+                merged[field] = fight[field]
+                provenance[field] = source
+                break
+        else:
+            merged[field] = primary.get(field)
+            provenance[field] = primary_source
+
+    # Scraped time beats an estimate beats none; date/time stay a consistent pair
+    time_source, time_fight = max(listings, key=lambda item: _time_rank(item[1]))
+    for field in _TIME_FIELDS:
+        if any(field in fight for _, fight in listings):
+            merged[field] = time_fight.get(field, False if field == 'time_estimated' else None)
+            provenance[field] = time_source
+
+    # Keep the primary listing's key order
+    ordered = {k: merged[k] for k in primary if k in merged}
+    ordered.update(merged)
+    ordered['sources'] = list(dict.fromkeys(source for source, _ in listings))
+    ordered['provenance'] = provenance
+    return ordered
+
+
+def merge_fights(source_fights):
+    """
+    Merge and de-duplicate fights from several sources.
+
+    Args:
+        source_fights: [(source name, fights)] in priority order - for each
+            field the first source with a real value wins
+
+    Returns:
+        list of merged fight dicts (new objects), in order of first appearance
+    """
+    groups = []     # [(source, fight)] per merged fight
+    index = {}      # (sport, pair, date) -> positions in groups
+
+    for source, fights in source_fights:
+        for fight in fights:
+            sport, pair = fight.get('sport'), _pair(fight)
+            if any(name in _PLACEHOLDER_NAMES for name in pair):
+                groups.append([(source, fight)])
+                continue
+
+            keys = [(sport, pair, d) for d in _dates(fight)]
+            # A group this source already contributed to is a different bout
+            position = next((p for k in keys for p in index.get(k, ())
+                             if all(s != source for s, _ in groups[p])), None)
+            if position is None:
+                position = len(groups)
+                groups.append([])
+            groups[position].append((source, fight))
+            index.setdefault(keys[0], []).append(position)
+
+    return [_combine(listings) for listings in groups]
@@ -0,0 +1,169 @@
+"""
+Conditional Page Fetching
+Remembers, per scraped page, the validators the server sent (ETag /
+Last-Modified), a hash of the page region the scraper actually reads, and
+the fights parsed from it. The next fetch is a conditional GET; on a 304, or
+a 200 whose schedule region hashes the same, the previous fights are
+returned without parsing the page again.
+
+Layout (inside DATA_DIR/page_cache):
+    mmafighting.json
+    boxingschedule.json
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+
+from http_client import http
+from atomic_file import atomic_write
+
+logger = logging.getLogger('fight_schedule')
+
+# Resolve DATA_DIR the same way app.py does
+DATA_DIR = os.environ.get('DATA_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data'))
+PAGE_CACHE_DIR = os.environ.get('SCRAPER_PAGE_CACHE_DIR', os.path.join(DATA_DIR, 'page_cache'))
+
+# Parsed results are re-derived at least this often even if the page never
+# changes, since parsing depends on today's date (year rollover, past events)
+MAX_REUSE = timedelta(hours=int(os.environ.get('SCRAPER_PAGE_REUSE_HOURS', 24)))
+
+# Inline scripts carry per-request nonces, ad slots and tracking ids
+_SCRIPT_RE = re.compile(r'<script\b.*?</script>', re.IGNORECASE | re.DOTALL)
+
+
+def extract_region(html, start_marker, end_marker=None):
+    """
+    The part of `html` a scraper reads: from the first `start_marker` to the
+    last `end_marker` (or the end of the page), with <script> blocks removed.
+    Falls back to the whole page if the start marker is missing.
+    """
+    start = html.find(start_marker)
+    if start < 0:
+        start = 0
+    end = html.rfind(end_marker) if end_marker else -1
+    if end <= start:
+        end = len(html)
+    return _SCRIPT_RE.sub('', html[start:end])
+
+
+class PageCache:
+    """Per-page validators, region hash and last parsed result"""
+
+    def __init__(self, directory=PAGE_CACHE_DIR, max_reuse=MAX_REUSE):
+        self.directory = directory
+        self.max_reuse = max_reuse
+        self._lock = threading.Lock()
+        self._stats = {'not_modified': 0, 'unchanged': 0, 'parsed': 0}
+
+    def _path(self, name):
+        return os.path.join(self.directory, f'{name}.json')
+
+    def _load(self, name):
+        try:
+            with open(self._path(name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Unreadable page cache for {name}: {e}")
+            return None
+
+    def _save(self, name, state):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            atomic_write(self._path(name), json.dumps(state))
+        except OSError as e:
+            logger.warning(f"Could not write page cache for {name}: {e}")
+
+    def _count(self, outcome):
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def _reusable(self, state, version):
+        if not state or not state.get('fights') or state.get('version') != version:
+            return False
+        try:
+            parsed_at = datetime.fromisoformat(state['parsed_at'])
+        except (KeyError, TypeError, ValueError):
+            return False
+        return datetime.now() - parsed_at <= self.max_reuse
+
+    def fetch(self, name, url, parse, region=None, version=1, **kwargs):
+        """
+        Conditionally GET `url` and return parse(response) - or the previous
+        result if the page (or its region) has not changed.
+
+        Args:
+            name: Stable cache key, e.g. the scraper source name
+            url: Page to fetch
+            parse: callable(response) -> list of fights
+            region: callable(html text) -> the part of the page `parse` reads;
+                default is the whole page
+            version: Bump when `parse` changes, so older results are re-parsed
+            **kwargs: Passed to http.get (headers, timeout, ...)
+
+        Raises:
+            requests exceptions from the GET, like http.get does. Non-200
+            responses are returned to `parse` unchanged.
+        """
+        state = self._load(name)
+        reusable = self._reusable(state, version)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if reusable:
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+
+        response = http.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and reusable:
+            self._count('not_modified')
+            print(f"{name}: page not modified, reusing {len(state['fights'])} parsed fights")
+            return copy.deepcopy(state['fights'])
+
+        if response.status_code != 200:
+            return parse(response)
+
+        text = response.text
+        digest = hashlib.sha256((region(text) if region else text).encode('utf-8')).hexdigest()
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+
+        if reusable and digest == state.get('region_hash'):
+            self._count('unchanged')
+            print(f"{name}: schedule unchanged, reusing {len(state['fights'])} parsed fights")
+            if validators != {'etag': state.get('etag'), 'last_modified': state.get('last_modified')}:
+                self._save(name, {**state, **validators})
+            return copy.deepcopy(state['fights'])
+
+        self._count('parsed')
+        fights = parse(response)
+        if fights:
+            self._save(name, {
+                'url': url,
+                'version': version,
+                'region_hash': digest,
+                'parsed_at': datetime.now().isoformat(),
+                'fights': fights,
+                **validators,
+            })
+        return fights
+
+    def stats(self):
+        """How each fetch in this process was served"""
+        with self._lock:
+            return dict(self._stats)
+
+
+# Process-wide cache used by the scrapers
+page_cache = PageCache()
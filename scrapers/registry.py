@@ -0,0 +1,118 @@
+"""
+Scraper Source Registry
+Every fight source registers itself with its sport, a timeout and the
+minimum number of fights a healthy scrape returns. run_sources() runs all
+enabled sources concurrently under one overall deadline, so a refresh takes
+as long as the slowest source instead of the sum of all of them.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+logger = logging.getLogger('fight_schedule')
+
+
+class ScraperSource:
+    """One fight source: `fetch()` returns a list of fight dicts"""
+
+    def __init__(self, name, label, sport, fetch, timeout=60, min_fights=1, enabled=True):
+        self.name = name              # Stable key, e.g. 'mmafighting'
+        self.label = label            # Human-readable name for logs
+        self.sport = sport            # 'UFC' | 'Boxing'
+        self.fetch = fetch
+        self.timeout = timeout        # Seconds before the source is abandoned
+        self.min_fights = min_fights  # Fewer than this = the scrape is treated as broken
+        self.enabled = enabled
+
+
+class SourceResult:
+    """Outcome of one source in a run"""
+
+    def __init__(self, source, fights=None, status='ok', error=None, elapsed=0.0):
+        self.source = source
+        self.fights = fights or []
+        self.status = status          # 'ok' | 'too_few' | 'error' | 'timeout'
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.status == 'ok'
+
+    def describe(self):
+        return {
+            'source': self.source.name,
+            'sport': self.source.sport,
+            'status': self.status,
+            'fights': len(self.fights),
+            'min_fights': self.source.min_fights,
+            'elapsed': round(self.elapsed, 2),
+            'error': self.error,
+        }
+
+
+_SOURCES = {}
+
+
+def register_source(source):
+    """Add (or replace) a source; registration order is the merge order"""
+    _SOURCES[source.name] = source
+    return source
+
+
+def get_sources(include_disabled=False):
+    return [s for s in _SOURCES.values() if include_disabled or s.enabled]
+
+
+def _timed_fetch(source):
+    started = time.monotonic()
+    fights = source.fetch() or []
+    return fights, time.monotonic() - started
+
+
+def run_sources(sources=None, deadline=120):
+    """
+    Run sources in parallel.
+
+    Args:
+        sources: ScraperSources to run (default: every enabled source)
+        deadline: Overall seconds for the whole run; each source also gets
+            its own `timeout`, whichever ends first
+
+    Returns:
+        list[SourceResult] in registration order. Sources that miss their
+        deadline are reported as 'timeout'; their threads are left to finish
+        in the background and their results discarded.
+    """
+    sources = list(get_sources() if sources is None else sources)
+    if not sources:
+        return []
+
+    started = time.monotonic()
+    pool = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='scraper')
+    futures = [(source, pool.submit(_timed_fetch, source)) for source in sources]
+
+    results = []
+    try:
+        for source, future in futures:
+            remaining = min(source.timeout, deadline) - (time.monotonic() - started)
+            try:
+                fights, elapsed = future.result(timeout=max(0, remaining))
+            except FutureTimeoutError:
+                logger.error(f"Scraper {source.name} timed out")
+                results.append(SourceResult(source, status='timeout', error='timed out',
+                                            elapsed=time.monotonic() - started))
+                continue
+            except Exception as e:
+                logger.error(f"Scraper {source.name} failed: {e}", exc_info=True)
+                results.append(SourceResult(source, status='error', error=str(e),
+                                            elapsed=time.monotonic() - started))
+                continue
+
+            status = 'ok' if len(fights) >= source.min_fights else 'too_few'
+            results.append(SourceResult(source, fights, status, elapsed=elapsed))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return results
@@ -0,0 +1,57 @@
+"""
+HTML Parsing Backend
+BeautifulSoup with the fastest tree builder available: lxml if it is
+installed, otherwise the pure-Python html.parser. SCRAPER_HTML_PARSER
+overrides the choice (e.g. to compare results between backends).
+
+Scrapers pass a SoupStrainer for the page container that holds the
+schedule (their SCHEDULE_SCOPE, e.g. <main>) so only that subtree is
+built, and fall back to the whole page if the scoped tree yields
+nothing - e.g. after a site redesign moves the schedule elsewhere.
+"""
+
+import logging
+import os
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger('fight_schedule')
+
+
+def _default_parser():
+    try:
+        import lxml  # noqa: F401
+        return 'lxml'
+    except ImportError:
+        return 'html.parser'
+
+
+HTML_PARSER = os.environ.get('SCRAPER_HTML_PARSER') or _default_parser()
+
+
+def make_soup(markup, parse_only=None):
+    """BeautifulSoup tree of `markup` (str or bytes) built with HTML_PARSER"""
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=parse_only)
+
+
+def parse_scoped(markup, parse, scope=None):
+    """
+    Run `parse(soup)` on a tree limited to `scope`.
+
+    Args:
+        markup: Page HTML (str or bytes)
+        parse: callable(soup) -> list of results
+        scope: SoupStrainer for the element(s) that contain everything
+            `parse` looks at, or None to parse the whole page
+
+    Returns:
+        parse()'s result on the scoped tree, or on the full page if the
+        scoped tree gave no results.
+    """
+    if scope is not None:
+        results = parse(make_soup(markup, parse_only=scope))
+        if results:
+            return results
+        logger.info("Scoped parse found nothing - parsing the full page")
+    return parse(make_soup(markup))
+
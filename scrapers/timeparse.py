@@ -0,0 +1,181 @@
+"""
+Date/Time Parsing for the Scrapers
+Everything the scrapers need to turn schedule text into UTC dates and times:
+ET card times ("10 p.m. ET"), boxing header times ("🇬🇧 10:00 PM"), header
+dates ("📅 December 20") and start times estimated from the venue.
+
+Patterns are compiled once at import and ZoneInfo objects are cached, so
+parsing a header costs a few regex searches instead of recompiling them for
+every paragraph.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+from .gazetteer import lookup_venue, main_card_start
+
+
+@lru_cache(maxsize=None)
+def zone(name):
+    """Cached ZoneInfo for an IANA name"""
+    return ZoneInfo(name)
+
+
+UTC_ZONE = zone('UTC')
+ET_ZONE = zone('America/New_York')
+UK_ZONE = zone('Europe/London')
+
+
+# ============================================================================
+# ET CARD TIMES (MMA Fighting)
+# ============================================================================
+
+_ET_TIME_RE = re.compile(r'(\d+)(?::(\d+))?\s*(a\.m\.|p\.m\.)')
+MAIN_CARD_TIME_RE = re.compile(r'main card.*?(\d+(?::\d+)?\s*(?:a\.m\.|p\.m\.)\s*ET)', re.IGNORECASE)
+PRELIM_TIME_RE = re.compile(r'prelim(?:s|inary card)?.*?(\d+(?::\d+)?\s*(?:a\.m\.|p\.m\.)\s*ET)', re.IGNORECASE)
+
+
+def convert_et_to_utc(time_et_str, event_date=None):
+    """Convert ET time to UTC, handling EST/EDT automatically via zoneinfo.
+
+    Args:
+        time_et_str: Time string like "10 p.m. ET" or "6:30 p.m. ET"
+        event_date: Optional date string (YYYY-MM-DD) for accurate DST lookup.
+                    Falls back to today if not provided.
+
+    Returns:
+        datetime (UTC, timezone-aware) or None. The date component may differ
+        from event_date when the ET time crosses midnight into the next UTC day.
+    """
+    try:
+        time_match = _ET_TIME_RE.search(time_et_str.lower())
+        if not time_match:
+            return None
+
+        hour = int(time_match.group(1))
+        minute = int(time_match.group(2)) if time_match.group(2) else 0
+        am_pm = time_match.group(3)
+
+        # Convert to 24-hour format
+        if am_pm == 'p.m.' and hour != 12:
+            hour += 12
+        elif am_pm == 'a.m.' and hour == 12:
+            hour = 0
+
+        # Use event date for accurate DST determination, fall back to today
+        if event_date:
+            try:
+                ref_date = datetime.strptime(event_date, '%Y-%m-%d').date()
+            except ValueError:
+                ref_date = datetime.now(UTC_ZONE).date()
+        else:
+            ref_date = datetime.now(UTC_ZONE).date()
+
+        # Build timezone-aware ET datetime, then convert to UTC
+        et_dt = datetime(ref_date.year, ref_date.month, ref_date.day,
+                         hour, minute, tzinfo=ET_ZONE)
+        return et_dt.astimezone(UTC_ZONE)
+    except Exception:
+        return None
+
+
+# ============================================================================
+# BOXING HEADERS (BoxingSchedule.co)
+# ============================================================================
+
+HEADER_DATE_RE = re.compile(r'📅\s+([A-Za-z]+\s+\d+)')
+
+# Header time patterns in priority order (site format varies); the first
+# pattern that matches and parses wins, wherever it sits in the header
+HEADER_TIME_PATTERNS = [
+    # "UK London: 10:00 PM" or "UK London: 2:30 AM"
+    (re.compile(r'UK\s*(?:London)?[:\s]+(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE), UK_ZONE),
+    # "🇬🇧 10:00 PM" or flag followed by time
+    (re.compile(r'🇬🇧\s*(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE), UK_ZONE),
+    # "Time: 10:00 PM" or "Start: 10:00 PM"
+    (re.compile(r'(?:Time|Start)[:\s]+(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE), UK_ZONE),
+    # "ET: 5:00 PM" or "EST: 5:00 PM" - US Eastern
+    (re.compile(r'(?:ET|EST|Eastern)[:\s]+(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE), ET_ZONE),
+    # "PT: 2:00 PM" or "PST: 2:00 PM" - US Pacific
+    (re.compile(r'(?:PT|PST|Pacific)[:\s]+(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE), zone('America/Los_Angeles')),
+    # "CT: 4:00 PM" or "CST: 4:00 PM" - US Central
+    (re.compile(r'(?:CT|CST|Central)[:\s]+(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE), zone('America/Chicago')),
+    # Bare time at end like "| 10:00 PM" or "– 10:00 PM"
+    (re.compile(r'[|–—-]\s*(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE), UK_ZONE),
+    # Any standalone 12-hour time as last resort
+    (re.compile(r'(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE), UK_ZONE),
+]
+
+
+def parse_header_date(date_str, now=None):
+    """
+    "December 20" -> datetime in the current year, or next year if that date
+    is more than 60 days in the past (December → January rollover).
+    Returns None if the text is not a valid date.
+    """
+    now = now or datetime.now()
+    try:
+        # Parse date with current year first
+        date_obj = datetime.strptime(f"{date_str} {now.year}", "%B %d %Y")
+        if (now - date_obj).days > 60:
+            date_obj = datetime.strptime(f"{date_str} {now.year + 1}", "%B %d %Y")
+    except ValueError:
+        return None
+    return date_obj
+
+
+def parse_header_time(text, date_obj):
+    """
+    UTC start time from a boxing date header.
+
+    Returns:
+        (utc 'HH:MM', matched time text, pattern) or None if no pattern parses
+    """
+    for pattern, local_tz in HEADER_TIME_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            time_str = match.group(1).strip()
+            try:
+                time_obj = datetime.strptime(time_str, "%I:%M %p")
+            except ValueError:
+                continue
+            local_dt = datetime(date_obj.year, date_obj.month, date_obj.day,
+                                time_obj.hour, time_obj.minute, tzinfo=local_tz)
+            return local_dt.astimezone(UTC_ZONE).strftime("%H:%M"), time_str, pattern.pattern
+    return None
+
+
+# ============================================================================
+# VENUE FALLBACK TIMES
+# ============================================================================
+
+def estimate_time_from_venue(venue_text, event_date=None):
+    """
+    Estimate a UTC start time from the venue/location (see gazetteer.py):
+    the country's usual local main card start, converted with the real UTC
+    offset on the event date so estimates follow DST.
+
+    Args:
+        venue_text: Venue/location string from the schedule
+        event_date: date/datetime or 'YYYY-MM-DD' of the event (default: today)
+
+    Returns (time_str, True) if estimated, or (None, False) if can't estimate.
+    """
+    place = lookup_venue(venue_text)
+    if place is None:
+        return None, False
+
+    if isinstance(event_date, str):
+        try:
+            event_date = datetime.strptime(event_date, '%Y-%m-%d')
+        except ValueError:
+            event_date = None
+    event_date = event_date or datetime.now(UTC_ZONE)
+
+    zone_name, start = main_card_start(place)
+    hour, minute = map(int, start.split(':'))
+    local_dt = datetime(event_date.year, event_date.month, event_date.day,
+                        hour, minute, tzinfo=zone(zone_name))
+    return local_dt.astimezone(UTC_ZONE).strftime("%H:%M"), True
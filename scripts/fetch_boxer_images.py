@@ -1,8 +1,8 @@
 """
 Automatically fetch missing boxer images from Wikipedia.
 
-Finds all boxers that appear in fighters.json (null entry) or in the live
-schedule cache but have no image entry at all, then queries the Wikipedia
+Finds all boxers that appear in fighters.json (null entry) or in the published
+schedule snapshot but have no image entry at all, then queries the Wikipedia
 API for each one, downloads whatever thumbnail it finds, saves it to
 static/fighters/, and updates data/fighters.json.
 
@@ -26,11 +26,14 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = Path(os.environ.get('DATA_DIR', ROOT / 'data'))
 FIGHTERS_JSON = DATA_DIR / 'fighters.json'
-CACHE_JSON = DATA_DIR / 'fights_cache.json'
+SNAPSHOT_DIR = DATA_DIR / 'snapshots'
 STATIC_DIR = ROOT / 'static' / 'fighters'
 
 STATIC_DIR.mkdir(parents=True, exist_ok=True)
 
+sys.path.insert(0, str(ROOT))
+from snapshot_store import SnapshotStore  # noqa: E402
+
 
 def to_slug(name: str) -> str:
     """Convert fighter name to a filesystem-safe slug."""
@@ -54,13 +57,14 @@ def save_fighters_db(db: dict):
 
 
 def boxers_from_schedule() -> list[str]:
-    """Return boxer names from the live schedule cache."""
-    if not CACHE_JSON.exists():
+    """Return boxer names from the published schedule snapshot."""
+    try:
+        snapshot = SnapshotStore(str(SNAPSHOT_DIR)).load_current()
+    except Exception as e:
+        print(f"Could not load schedule snapshot: {e}")
         return []
-    with open(CACHE_JSON) as f:
-        cache = json.load(f)
     names = set()
-    for fight in cache.get('fights', []):
+    for fight in (snapshot['fights'] if snapshot else []):
         if fight.get('sport') == 'Boxing':
             names.add(fight['fighter1'])
             names.add(fight['fighter2'])
@@ -0,0 +1,168 @@
+"""
+Single-Flight Helpers
+SingleFlight coalesces concurrent calls for the same key inside a process;
+FileLease is the cross-worker counterpart, so only one gunicorn worker runs
+an expensive job (scraping every source, generating a preview) at a time
+while the others keep serving.
+"""
+
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines - fall back to lock files
+    fcntl = None
+
+
+class FileLease:
+    """
+    Exclusive lock shared by every process that uses the same path.
+
+    On POSIX this is an flock() on the file, so the lock is released by the
+    kernel if the holder crashes. Elsewhere it falls back to an O_EXCL lock
+    file that other processes may take over once it is older than `ttl`.
+    """
+
+    def __init__(self, path, ttl=600):
+        self.path = path
+        self.ttl = ttl
+        self._fd = None
+
+    @property
+    def held(self):
+        return self._fd is not None
+
+    def _try_acquire(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+
+        if fcntl is not None:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                return False
+            os.ftruncate(fd, 0)
+            os.write(fd, f"{os.getpid()} {time.time():.0f}\n".encode())
+            self._fd = fd
+            return True
+
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            try:
+                expired = time.time() - os.path.getmtime(self.path) > self.ttl
+            except OSError:
+                expired = True  # Holder released between our two calls
+            if expired:
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+            return False
+        os.write(fd, f"{os.getpid()} {time.time():.0f}\n".encode())
+        self._fd = fd
+        return True
+
+    def acquire(self, timeout=0, poll_interval=0.25):
+        """
+        Try to take the lease.
+
+        Args:
+            timeout: Seconds to keep retrying (0 = single non-blocking attempt)
+
+        Returns:
+            bool: True if this process now holds the lease
+        """
+        if self._fd is not None:
+            return True
+
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._try_acquire():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+
+    def release(self):
+        """Release the lease if held (safe to call more than once)"""
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+        else:
+            os.close(fd)
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    In-process call coalescing: while a call for `key` is running, other
+    threads asking for the same key wait for it and share its result (or
+    exception) instead of running the function again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) unless a call for key is already in flight.
+
+        Returns:
+            (result, shared): shared is True if another thread's result was reused
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._calls
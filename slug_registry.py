@@ -0,0 +1,162 @@
+"""
+Canonical Event Slug Registry
+Built once per fight snapshot: maps every event URL slug to its event and
+every event back to its one canonical slug, plus old/variant slugs that
+should 301 to the canonical URL. Events are grouped by the event_id stored
+on each fight (see fight_ids.py), and all lookups are plain dict hits.
+"""
+
+import re
+import unicodedata
+
+from fight_ids import ensure_ids
+
+
+def fighter_slug(name):
+    """Convert a fighter name to a URL slug, stripping diacritics and punctuation."""
+    normalized = unicodedata.normalize('NFD', name)
+    ascii_name = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+    return ascii_name.lower().replace(' ', '-').replace("'", '').replace('.', '')
+
+
+def ufc_event_slug(event_name, date):
+    """Canonical UFC event slug, e.g. 'ufc-323-dvalishvili-vs.-yan-2-2025-12-06'"""
+    name = event_name.lower().replace(' ', '-').replace(':', '').replace(',', '')
+    return f"{name}-{date}"
+
+
+def boxing_event_slug(fighter1, fighter2, date):
+    """Canonical boxing event slug, e.g. 'naoya-inoue-vs-alan-picasso-2025-12-27'"""
+    return f"{fighter_slug(fighter1)}-vs-{fighter_slug(fighter2)}-{date}"
+
+
+def _legacy_ufc_slugs(event_name, date):
+    """Variants produced by the old fuzzy name matcher"""
+    name = event_name.lower().replace(' ', '-').replace(':', '').replace(',', '')
+    yield f"{re.sub(r'[^a-z0-9-]', '', name)}-{date}"
+
+
+def _legacy_boxing_slugs(fight):
+    """Slugs older sitemap/search code generated for boxing events"""
+    # Old sitemap: no diacritic stripping, dots kept
+    f1 = fight['fighter1'].lower().replace(' ', '-').replace("'", '')
+    f2 = fight['fighter2'].lower().replace(' ', '-').replace("'", '')
+    yield f"{f1}-vs-{f2}-{fight['date']}"
+    # Old client-side search results linked by venue
+    venue = (fight.get('venue') or '').lower().replace(' ', '-').replace(',', '').replace('.', '').replace("'", '')
+    if venue:
+        yield f"{venue}-{fight['date']}"
+
+
+class SlugRegistry:
+    """
+    Slug <-> event maps for one snapshot.
+
+    UFC events are one card per event name. Every boxing headline gets its
+    own page (slug from its fighters); undercard slugs redirect to their headline.
+    """
+
+    def __init__(self, fights):
+        ensure_ids(fights)
+        self._fights = {f['fight_id']: f for f in reversed(fights)}  # First listing wins
+        self.ufc_events = {}      # canonical slug -> event dict
+        self.boxing_events = {}   # canonical slug -> event dict
+        self._event_urls = {}     # event_id -> canonical URL path
+        self._headlines = {}      # event_id -> fight shown as the event's main event
+        self._redirects = {}      # '/event/<old>' -> '/event/<canonical>'
+        self._ufc_by_date = {}    # date -> canonical slug (None if ambiguous)
+
+        self._build_ufc([f for f in fights if f.get('sport') == 'UFC'])
+        self._build_boxing([f for f in fights if f.get('sport') == 'Boxing'])
+
+    def _build_ufc(self, fights):
+        grouped = {}
+        for fight in fights:
+            grouped.setdefault(fight['event_id'], []).append(fight)
+
+        for event_id, event_fights in grouped.items():
+            event_name = event_fights[0].get('event_name', '')
+            main_card = [f for f in event_fights if f.get('card_type') == 'Main Card']
+            headline = main_card[0] if main_card else event_fights[0]
+            slug = ufc_event_slug(event_name, headline['date'])
+            self.ufc_events[slug] = {
+                'event_id': event_id,
+                'event_name': event_name,
+                'date': headline['date'],
+                'fights': event_fights,
+                'has_main_card': any(f.get('card_type') != 'Prelims' for f in event_fights),
+            }
+            self._event_urls[event_id] = f"/event/{slug}"
+            self._headlines[event_id] = headline
+
+            dates = {f['date'] for f in event_fights}
+            for date in dates:
+                self._ufc_by_date[date] = None if date in self._ufc_by_date else slug
+                for legacy in _legacy_ufc_slugs(event_name, date):
+                    self._add_redirect('/event/', legacy, slug)
+                self._add_redirect('/event/', ufc_event_slug(event_name, date), slug)
+
+    def _build_boxing(self, fights):
+        venue_groups = {}
+        for fight in fights:
+            venue_groups.setdefault((fight['date'], fight.get('venue')), []).append(fight)
+
+        # event_id already ties each undercard fight to the headline that
+        # opened its card, so the first fight seen per event_id is the headline
+        for fight in fights:
+            event_id = fight['event_id']
+            fight_slug = boxing_event_slug(fight['fighter1'], fight['fighter2'], fight['date'])
+
+            if event_id not in self._event_urls:
+                slug = fight_slug
+                self.boxing_events[slug] = {
+                    'event_id': event_id,
+                    'date': fight['date'],
+                    'venue': fight.get('venue'),
+                    'main_event': fight,
+                    'fights': venue_groups[(fight['date'], fight.get('venue'))],
+                }
+                self._event_urls[event_id] = f"/boxing-event/{slug}"
+                self._headlines[event_id] = fight
+            else:
+                slug = self._event_urls[event_id][len('/boxing-event/'):]
+                self._add_redirect('/boxing-event/', fight_slug, slug)
+
+            for legacy in _legacy_boxing_slugs(fight):
+                self._add_redirect('/boxing-event/', legacy, slug)
+
+    def _add_redirect(self, prefix, old_slug, canonical_slug):
+        if old_slug != canonical_slug:
+            self._redirects.setdefault(prefix + old_slug, prefix + canonical_slug)
+
+    def ufc_event(self, slug):
+        """Event dict for a canonical UFC slug, or None"""
+        return self.ufc_events.get(slug)
+
+    def boxing_event(self, slug):
+        """Event dict for a canonical boxing slug, or None"""
+        return self.boxing_events.get(slug)
+
+    def redirect_for(self, path):
+        """Canonical path an old/variant URL should 301 to, or None"""
+        target = self._redirects.get(path)
+        if target:
+            return target
+        # Renamed UFC events: fall back to the date if it is unambiguous
+        if path.startswith('/event/') and len(path) > 18:
+            slug = self._ufc_by_date.get(path[-10:])
+            if slug:
+                return '/event/' + slug
+        return None
+
+    def url_for(self, fight):
+        """Canonical event URL path for any fight in the snapshot"""
+        return self._event_urls.get(fight.get('event_id'))
+
+    def fight(self, fight_id):
+        """Fight record for a fight_id, or None"""
+        return self._fights.get(fight_id)
+
+    def headline_for(self, fight):
+        """The fight an event page shows as main event (and previews) for any fight on the card"""
+        return self._headlines.get(fight.get('event_id'))
@@ -0,0 +1,214 @@
+"""
+Versioned Fight Snapshot Store
+Every refresh is written as a new numbered generation and published by
+atomically replacing a CURRENT pointer, so readers in other workers never
+see a half-written file. The last few generations are kept for rollback.
+
+Layout (inside DATA_DIR/snapshots):
+    fights-000041.json
+    fights-000042.json
+    CURRENT              -> "42"
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime
+
+from atomic_file import atomic_write
+
+logger = logging.getLogger('fight_schedule')
+
+_GENERATION_RE = re.compile(r'^fights-(\d+)\.json$')
+
+
+class SnapshotStore:
+    """Numbered, atomically published generations of the fights cache"""
+
+    def __init__(self, directory, keep=5):
+        self.directory = directory
+        self.keep = max(1, keep)
+        self.current_path = os.path.join(directory, 'CURRENT')
+        os.makedirs(directory, exist_ok=True)
+
+    def _generation_path(self, generation):
+        return os.path.join(self.directory, f'fights-{generation:06d}.json')
+
+    def generations(self):
+        """All generation numbers on disk, oldest first"""
+        found = []
+        for name in os.listdir(self.directory):
+            match = _GENERATION_RE.match(name)
+            if match:
+                found.append(int(match.group(1)))
+        return sorted(found)
+
+    def current_generation(self):
+        """Generation the CURRENT pointer refers to, or None"""
+        try:
+            with open(self.current_path, 'r') as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def load(self, generation):
+        """
+        Load one generation.
+
+        Returns:
+            dict: {'generation', 'timestamp' (datetime), 'fights'}
+
+        Raises:
+            OSError / ValueError / KeyError if the file is missing or invalid
+        """
+        with open(self._generation_path(generation), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {
+            'generation': generation,
+            'timestamp': datetime.fromisoformat(data['timestamp']),
+            'fights': data['fights'],
+        }
+
+    def load_current(self):
+        """Load the published generation, falling back to the last good one"""
+        generation = self.current_generation()
+        if generation is None:
+            return None
+        try:
+            return self.load(generation)
+        except Exception as e:
+            logger.error(f"Snapshot generation {generation} unreadable ({e}), falling back")
+            return self.load_last_good(before=generation)
+
+    def load_last_good(self, before=None, max_age=None):
+        """
+        Newest generation that parses cleanly.
+
+        Args:
+            before: Only consider generations older than this one
+            max_age: Optional timedelta; skip generations older than this
+        """
+        for generation in reversed(self.generations()):
+            if before is not None and generation >= before:
+                continue
+            try:
+                snapshot = self.load(generation)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable snapshot generation {generation}: {e}")
+                continue
+            if max_age is not None and datetime.now() - snapshot['timestamp'] > max_age:
+                return None
+            return snapshot
+        return None
+
+    def write(self, fights, timestamp=None):
+        """Write fights as a new generation, publish it, and prune old ones"""
+        timestamp = timestamp or datetime.now()
+        existing = self.generations()
+        generation = (existing[-1] + 1) if existing else 1
+
+        payload = json.dumps({'timestamp': timestamp.isoformat(), 'fights': fights})
+        atomic_write(self._generation_path(generation), payload)
+        self.publish(generation)
+        self.prune()
+        return generation
+
+    def publish(self, generation):
+        """Point CURRENT at an existing generation (used for rollback too)"""
+        if not os.path.exists(self._generation_path(generation)):
+            raise ValueError(f"Snapshot generation {generation} does not exist")
+        atomic_write(self.current_path, f'{generation}\n')
+
+    def rollback(self, generation):
+        """Re-publish an older generation after checking that it loads"""
+        self.load(generation)
+        self.publish(generation)
+        logger.warning(f"Rolled snapshot back to generation {generation}")
+
+    def clear(self):
+        """Unpublish the current generation (older ones stay for rollback)"""
+        try:
+            os.remove(self.current_path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def prune(self):
+        """Delete all but the newest `keep` generations (never the current one)"""
+        current = self.current_generation()
+        for generation in self.generations()[:-self.keep]:
+            if generation == current:
+                continue
+            try:
+                os.remove(self._generation_path(generation))
+            except OSError:
+                pass
+
+    def describe(self):
+        """Summary of every generation on disk, newest first"""
+        current = self.current_generation()
+        summary = []
+        for generation in reversed(self.generations()):
+            entry = {'generation': generation, 'current': generation == current}
+            try:
+                snapshot = self.load(generation)
+                entry['timestamp'] = snapshot['timestamp'].isoformat()
+                entry['fights'] = len(snapshot['fights'])
+            except Exception as e:
+                entry['error'] = str(e)
+            summary.append(entry)
+        return summary
+
+    def import_legacy(self, legacy_path):
+        """One-shot migration of an old single-file fights_cache.json"""
+        if self.generations() or not os.path.exists(legacy_path):
+            return None
+        try:
+            with open(legacy_path, 'r') as f:
+                data = json.load(f)
+            generation = self.write(data['fights'], datetime.fromisoformat(data['timestamp']))
+        except Exception as e:
+            logger.warning(f"Could not import legacy cache {legacy_path}: {e}")
+            return None
+        logger.info(f"Imported legacy cache {legacy_path} as snapshot generation {generation}")
+        return generation
+
+
+class SourceCache:
+    """
+    Last successful result of each scraper source (sources/<name>.json), so a
+    refresh where one source breaks can reuse that source's previous fights
+    instead of discarding everything the healthy sources returned.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name):
+        return os.path.join(self.directory, f'{name}.json')
+
+    def save(self, name, fights, timestamp=None):
+        timestamp = timestamp or datetime.now()
+        payload = json.dumps({'source': name, 'timestamp': timestamp.isoformat(), 'fights': fights})
+        atomic_write(self._path(name), payload)
+
+    def load(self, name, max_age=None):
+        """
+        Returns:
+            dict: {'timestamp' (datetime), 'fights'}, or None if missing,
+            unreadable or older than max_age (timedelta)
+        """
+        try:
+            with open(self._path(name), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            timestamp = datetime.fromisoformat(data['timestamp'])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Unreadable last-good cache for source {name}: {e}")
+            return None
+        if max_age is not None and datetime.now() - timestamp > max_age:
+            return None
+        return {'timestamp': timestamp, 'fights': data['fights']}
@@ -0,0 +1,45 @@
+import pytest
+
+from scrapers.gazetteer import lookup_venue
+from scrapers.timeparse import estimate_time_from_venue
+
+
+@pytest.mark.parametrize('venue, country, zone', [
+    ('AO Arena, Manchester, UK', 'gb', 'Europe/London'),
+    ('MGM Grand, Las Vegas, NV', 'us', 'America/Los_Angeles'),
+    ('Belfast, Northern Ireland', 'gb', 'Europe/London'),
+    ('Capital One Arena, Washington, D.C.', 'us', 'America/New_York'),
+    ('Estadio Azteca, Ciudad de México', 'mx', 'America/Mexico_City'),
+    # Right-most place decides the country
+    ('Toyota Arena, Ontario, CA', 'us', 'America/Los_Angeles'),
+    ('Scotiabank Arena, Toronto, Ontario', 'ca', 'America/Toronto'),
+    # State codes alone still resolve
+    ('Simmons Bank Arena, Little Rock, AR', 'us', 'America/Chicago'),
+    ('Ball Arena, Denver, CO', 'us', 'America/Denver'),
+    ('Gainbridge Fieldhouse, Indianapolis, IN', 'us', 'America/Indiana/Indianapolis'),
+    # Codes that are also country codes don't override a foreign place
+    ('Uber Arena, Berlin, DE', 'de', 'Europe/Berlin'),
+    ('Panama City, PA', 'pa', 'America/Panama'),
+    ('Movistar Arena, Bogota, CO', 'co', 'America/Bogota'),
+    ('NSCI Dome, Mumbai, IN', 'in', 'Asia/Kolkata'),
+    ('Luna Park, Buenos Aires, AR', 'ar', 'America/Argentina/Buenos_Aires'),
+])
+def test_lookup_venue(venue, country, zone):
+    place = lookup_venue(venue)
+    assert (place.country, place.zone) == (country, zone)
+
+
+@pytest.mark.parametrize('venue', ['', None, 'Somewhere', 'Amusement Hall, XX'])
+def test_lookup_venue_unknown(venue):
+    assert lookup_venue(venue) is None
+
+
+def test_foreign_city_with_state_like_code_gets_local_evening():
+    # 22:00 CET, not the 9 PM ET slot a Delaware venue would get
+    assert estimate_time_from_venue('Uber Arena, Berlin, DE', '2026-01-10') == ('21:00', True)
+
+
+def test_bare_us_country_code_gets_a_time():
+    # 9 PM Eastern (EST in January)
+    assert estimate_time_from_venue('Arena, US', '2026-01-10') == ('02:00', True)
+    assert lookup_venue('Madison Square Garden, New York, US').zone == 'America/New_York'
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scrapers import boxing_scraper, soup, ufc_scraper
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+SCRAPERS = [
+    pytest.param(ufc_scraper, ufc_scraper.parse_ufc_schedule, 'mmafighting_schedule.html', 9, id='mmafighting'),
+    pytest.param(boxing_scraper, boxing_scraper.parse_boxing_schedule, 'boxingschedule.html', 7, id='boxingschedule'),
+]
+
+
+def _read(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+def _reference(module, html):
+    """What the scraper returned before the lxml switch: full page, html.parser"""
+    return module._parse_schedule_soup(BeautifulSoup(html, 'html.parser'))
+
+
+@pytest.mark.parametrize('module, parse, fixture, count', SCRAPERS)
+def test_fixture_parses(module, parse, fixture, count):
+    assert len(_reference(module, _read(fixture))) == count
+
+
+@pytest.mark.parametrize('module, parse, fixture, count', SCRAPERS)
+@pytest.mark.parametrize('parser', ['html.parser', 'lxml'])
+def test_scoped_parse_matches_html_parser(module, parse, fixture, count, parser, monkeypatch):
+    if parser == 'lxml':
+        pytest.importorskip('lxml')
+    monkeypatch.setattr(soup, 'HTML_PARSER', parser)
+    html = _read(fixture)
+
+    # The <main> scope alone must find every fight, without the full-page fallback
+    scoped = module._parse_schedule_soup(soup.make_soup(html, parse_only=module.SCHEDULE_SCOPE))
+    assert scoped == _reference(module, html)
+    assert parse(html) == scoped
+
+
+@pytest.mark.parametrize('module, parse, fixture, count', SCRAPERS)
+def test_full_page_lxml_matches_html_parser(module, parse, fixture, count):
+    pytest.importorskip('lxml')
+    html = _read(fixture)
+    assert module._parse_schedule_soup(BeautifulSoup(html, 'lxml')) == _reference(module, html)
+
+
+def test_scoped_parse_falls_back_to_full_page():
+    html = _read('boxingschedule.html').replace(b'<main', b'<div').replace(b'</main>', b'</div>')
+    assert boxing_scraper.parse_boxing_schedule(html) == _reference(boxing_scraper, html)
@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pytest
+
+from scrapers.timeparse import (
+    HEADER_TIME_PATTERNS, convert_et_to_utc, estimate_time_from_venue,
+    parse_header_date, parse_header_time,
+)
+
+
+@pytest.mark.parametrize('time_str, event_date, expected', [
+    # EST (UTC-5) until 2026-03-08 02:00, EDT (UTC-4) from then on
+    ('8 p.m. ET', '2026-03-07', '2026-03-08 01:00'),
+    ('8 p.m. ET', '2026-03-08', '2026-03-09 00:00'),
+    # Back to EST on 2026-11-01
+    ('6:30 p.m. ET', '2026-10-31', '2026-10-31 22:30'),
+    ('6:30 p.m. ET', '2026-11-01', '2026-11-01 23:30'),
+    ('12 a.m. ET', '2026-01-10', '2026-01-10 05:00'),
+    ('12 p.m. ET', '2026-07-10', '2026-07-10 16:00'),
+])
+def test_convert_et_to_utc_follows_dst(time_str, event_date, expected):
+    assert convert_et_to_utc(time_str, event_date=event_date).strftime('%Y-%m-%d %H:%M') == expected
+
+
+def test_convert_et_to_utc_rejects_text_without_time():
+    assert convert_et_to_utc('TBA', event_date='2026-01-10') is None
+
+
+WINTER = datetime(2026, 1, 10)
+SUMMER = datetime(2026, 7, 10)
+
+
+@pytest.mark.parametrize('text, date_obj, expected_time, pattern_index', [
+    # Pattern order decides, not position in the header
+    ('📅 January 10: MSG | ET: 5:00 PM | 🇬🇧 10:00 PM', WINTER, '22:00', 1),
+    ('📅 January 10: O2 | 🇬🇧 9:00 PM | UK London: 10:00 PM', WINTER, '22:00', 0),
+    ('📅 July 10: MSG | PT: 2:00 PM | ET: 5:00 PM', SUMMER, '21:00', 3),
+    ('📅 July 10: Arena | CT: 6:00 PM', SUMMER, '23:00', 5),
+    # A match that doesn't parse ("9:00PM") falls through to the next pattern
+    ('📅 January 10: Arena | Time: 9:00PM | 10:00 PM', WINTER, '22:00', 6),
+    ('📅 July 10: Arena 7:30 pm', SUMMER, '18:30', 7),
+])
+def test_parse_header_time_pattern_priority(text, date_obj, expected_time, pattern_index):
+    utc_time, _, pattern = parse_header_time(text, date_obj)
+    assert utc_time == expected_time
+    assert pattern == HEADER_TIME_PATTERNS[pattern_index][0].pattern
+
+
+def test_parse_header_time_without_time():
+    assert parse_header_time('📅 January 10: Somewhere', WINTER) is None
+
+
+@pytest.mark.parametrize('date_str, expected', [
+    ('December 1', datetime(2026, 12, 1)),
+    ('December 31', datetime(2026, 12, 31)),
+    # Early-year dates seen in December belong to next year
+    ('January 5', datetime(2027, 1, 5)),
+    # Up to 60 days in the past is still this year
+    ('October 25', datetime(2026, 10, 25)),
+    ('October 1', datetime(2027, 10, 1)),
+    ('February 30', None),
+    ('Smarch 3', None),
+])
+def test_parse_header_date_rollover(date_str, expected):
+    assert parse_header_date(date_str, now=datetime(2026, 12, 20)) == expected
+
+
+@pytest.mark.parametrize('venue, event_date, expected', [
+    # 22:00 UK local: GMT in winter, BST in summer
+    ('AO Arena, Manchester, UK', '2026-01-10', '22:00'),
+    ('AO Arena, Manchester, UK', '2026-07-10', '21:00'),
+    # US cards follow the 9 PM ET broadcast slot
+    ('MGM Grand, Las Vegas, NV', '2026-01-10', '02:00'),
+    ('MGM Grand, Las Vegas, NV', '2026-07-10', '01:00'),
+    # No DST
+    ('Kingdom Arena, Riyadh', '2026-01-10', '17:00'),
+    ('Kingdom Arena, Riyadh', '2026-07-10', '17:00'),
+    # Southern hemisphere: AEDT in January, AEST in July
+    ('Qudos Bank Arena, Sydney', '2026-01-10', '09:00'),
+    ('Qudos Bank Arena, Sydney', '2026-07-10', '10:00'),
+])
+def test_estimate_time_from_venue_uses_event_date_offset(venue, event_date, expected):
+    assert estimate_time_from_venue(venue, event_date) == (expected, True)
+
+
+@pytest.mark.parametrize('venue', ['', None, 'Somewhere', 'TBA'])
+def test_estimate_time_from_venue_unknown(venue):
+    assert estimate_time_from_venue(venue, '2026-01-10') == (None, False)